@@ -13,19 +13,29 @@ And can now be cleanly imported for testing:
 from scripts.backend_manager import (
     ServerManager,
     check_all_ports,
+    find_ports_in_use,
     generate_nginx_config,
     generate_rest_location_blocks,
     generate_upstream_blocks,
     generate_websocket_location_block,
     is_port_in_use,
+    nginx_config_digest,
+    read_nginx_config_digest,
+    render_nginx_config,
+    write_nginx_config,
 )
 
 __all__ = [
     "ServerManager",
     "check_all_ports",
+    "find_ports_in_use",
     "generate_nginx_config",
     "generate_rest_location_blocks",
     "generate_upstream_blocks",
     "generate_websocket_location_block",
     "is_port_in_use",
+    "nginx_config_digest",
+    "read_nginx_config_digest",
+    "render_nginx_config",
+    "write_nginx_config",
 ]
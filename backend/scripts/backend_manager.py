@@ -24,14 +24,19 @@ Examples:
 
 import argparse
 import asyncio
+import hashlib
 import json
 import logging
 import os
+import random
+import select
+import shutil
 import signal
 import socket
 import subprocess
 import sys
 import time
+from functools import cache, cached_property
 from math import pi
 from pathlib import Path
 from typing import Any, TextIO
@@ -41,7 +46,12 @@ import httpx
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from trading_api.shared.deployment import DeploymentConfig, load_config  # noqa: E402
+from trading_api.shared.deployment import (  # noqa: E402
+    DeploymentConfig,
+    ServerConfig,
+    load_config,
+)
+from trading_api.shared.utils import write_file_bytes  # noqa: E402
 
 # Configure logging
 logging.basicConfig(
@@ -51,6 +61,20 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Generated files and management scripts excluded from uvicorn auto-reload
+# to prevent reload loops
+UVICORN_RELOAD_EXCLUDES = (
+    "*/openapi.json",
+    "*/asyncapi.json",
+    "*/clients/*",
+    "*/ws_generated/*",
+    "*/.local/*",
+    "*/.pids/*",
+    "*/scripts/*",
+    "*/__pycache__/*",
+    "*.pyc",
+)
+
 
 # ============================================================================
 # Server Manager - Process Management
@@ -99,57 +123,107 @@ def check_all_ports(config: DeploymentConfig) -> tuple[bool, list[tuple[str, int
     return len(blocked_ports) == 0, blocked_ports
 
 
+async def find_ports_in_use(ports: list[int]) -> list[int]:
+    """Find which of the given ports are in use.
+
+    The bind probes run concurrently in worker threads, so polling many ports
+    does not block the event loop.
+
+    Args:
+        ports: Port numbers to check
+
+    Returns:
+        Ports that are in use, in input order
+    """
+    results = await asyncio.gather(
+        *(asyncio.to_thread(is_port_in_use, port) for port in ports)
+    )
+    return [port for port, in_use in zip(ports, results) if in_use]
+
+
 async def wait_for_health(
-    base_url: str, modules: list[str], max_attempts: int = 30, delay: float = 0.5
+    base_url: str,
+    modules: list[str],
+    max_attempts: int = 30,
+    delay: float = 0.5,
+    client: httpx.AsyncClient | None = None,
+    initial_delay: float = 0.05,
 ) -> bool:
     """Wait for all modules on a service to become healthy.
 
+    The delay between attempts starts at initial_delay and doubles up to
+    delay, so a service that comes up quickly is detected quickly while a
+    slow one is not polled more often than before. Each delay is randomized
+    between half and all of its value, so instances started together do not
+    poll in lockstep. Polling stops after max_attempts * delay seconds,
+    regardless of how many attempts that took.
+
     Args:
         base_url: Base URL of the service
         modules: List of module names to check
-        max_attempts: Maximum number of connection attempts
-        delay: Delay between attempts in seconds
+        max_attempts: Number of attempts at the maximum delay that make up
+            the overall timeout (max_attempts * delay seconds)
+        delay: Maximum delay between attempts in seconds
+        client: HTTP client to reuse (a temporary one is created if omitted)
+        initial_delay: Delay after the first failed attempt in seconds
 
     Returns:
         True if all modules are healthy, False otherwise
     """
-    async with httpx.AsyncClient() as client:
-        for attempt in range(max_attempts):
-            all_healthy = True
+    if client is None:
+        async with httpx.AsyncClient() as client:
+            return await wait_for_health(
+                base_url,
+                modules,
+                max_attempts=max_attempts,
+                delay=delay,
+                client=client,
+                initial_delay=initial_delay,
+            )
 
-            for module in modules:
-                try:
-                    response = await client.get(
-                        f"{base_url}/api/v1/{module}/health", timeout=2.0
-                    )
-                    if response.status_code != 200:
-                        all_healthy = False
-                        break
-                except (
-                    httpx.ConnectError,
-                    httpx.RemoteProtocolError,
-                    httpx.TimeoutException,
-                ):
-                    all_healthy = False
-                    break
-                except Exception as e:
-                    logger.warning(
-                        f"Unexpected error checking health for {module} at {base_url}: {e}"
-                    )
+    timeout = max_attempts * delay
+    deadline = time.monotonic() + timeout
+    attempt = 0
+
+    while True:
+        all_healthy = True
+
+        for module in modules:
+            try:
+                response = await client.get(
+                    f"{base_url}/api/v1/{module}/health", timeout=2.0
+                )
+                if response.status_code != 200:
                     all_healthy = False
                     break
-
-            if all_healthy:
-                logger.info(
-                    f"All modules at {base_url} are healthy: {', '.join(modules)}"
+            except (
+                httpx.ConnectError,
+                httpx.RemoteProtocolError,
+                httpx.TimeoutException,
+            ):
+                all_healthy = False
+                break
+            except Exception as e:
+                logger.warning(
+                    f"Unexpected error checking health for {module} at {base_url}: {e}"
                 )
-                return True
+                all_healthy = False
+                break
+
+        if all_healthy:
+            logger.info(f"All modules at {base_url} are healthy: {', '.join(modules)}")
+            return True
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
 
-            if attempt < max_attempts - 1:
-                await asyncio.sleep(delay)
+        backoff = min(initial_delay * 2**attempt, delay)
+        await asyncio.sleep(min(random.uniform(backoff / 2, backoff), remaining))
+        attempt += 1
 
     logger.error(
-        f"Service at {base_url} failed to become healthy after {max_attempts} attempts"
+        f"Service at {base_url} failed to become healthy within {timeout:.1f}s"
     )
     return False
 
@@ -166,9 +240,40 @@ class ServerManager:
 
         Args:
             config: Deployment configuration
-            nginx_config_path: Path to nginx configuration file (relative to working directory)
         """
         self.config = config
+        # Every port the deployment binds (nginx first, then server instances)
+        self._all_ports = tuple(port for _, port in config.get_all_ports())
+        # Every server instance as (server_name, instance_name, port, server_config)
+        self._instances: tuple[tuple[str, str, int, ServerConfig], ...] = tuple(
+            (
+                server_name,
+                f"{server_name}-{instance_idx}",
+                server_config.port + instance_idx,
+                server_config,
+            )
+            for server_name, server_config in config.servers.items()
+            for instance_idx in range(server_config.instances)
+        )
+
+        # Launch state shared by every instance, built once rather than per spawn
+        self._base_env = os.environ.copy()
+        self._base_cmd = (
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "trading_api.main:app",
+            "--host",
+            "127.0.0.1",
+        )
+        self._reload_args = (
+            "--reload",
+            *(
+                arg
+                for pattern in UVICORN_RELOAD_EXCLUDES
+                for arg in ("--reload-exclude", pattern)
+            ),
+        )
 
         self.local_dir = Path(".local")
         self.pid_dir = self.local_dir / "pids"
@@ -184,11 +289,29 @@ class ServerManager:
         self.pid_dir.mkdir(parents=True, exist_ok=True)
         self.log_dir.mkdir(parents=True, exist_ok=True)
 
-        if not self.nginx_config_path.exists():
+    def prepare_nginx_config(self, regenerate: bool = False) -> None:
+        """Generate the nginx config if needed, otherwise validate the existing one.
+
+        A missing config is always generated. With regenerate, an existing
+        config is rewritten unless its header hash matches the current
+        deployment configuration and generator.
+
+        Args:
+            regenerate: Regenerate the config when its config hash is stale
+
+        Raises:
+            ValueError: If the existing nginx configuration is invalid
+        """
+        config_digest = nginx_config_digest(self.config, pid_file=self.nginx_pid_file)
+        if not self.nginx_config_path.exists() or (
+            regenerate
+            and read_nginx_config_digest(self.nginx_config_path) != config_digest
+        ):
             logger.info("Generating nginx configuration...")
             try:
-                with open(self.nginx_config_path, "w") as f:
-                    generate_nginx_config(config, f, pid_file=self.nginx_pid_file)
+                write_nginx_config(
+                    self.config, self.nginx_config_path, pid_file=self.nginx_pid_file
+                )
                 logger.info(f"Generated nginx config: {self.nginx_config_path}")
             except Exception as e:
                 logger.error(f"Failed to generate nginx config: {e}")
@@ -196,8 +319,9 @@ class ServerManager:
             if not validate_nginx_config(self.nginx_config_path):
                 raise ValueError("Invalid nginx configuration")
 
-    def _get_nginx_binary(self) -> str:
-        """Get nginx binary path (local or system).
+    @cached_property
+    def nginx_binary(self) -> str:
+        """Nginx binary path (local or system), resolved once per manager.
 
         Returns:
             Path to nginx binary
@@ -207,20 +331,14 @@ class ServerManager:
         """
         # Try local nginx first
         local_nginx = Path(__file__).parent.parent / ".local" / "bin" / "nginx"
-        if local_nginx.exists():
+        if local_nginx.is_file():
             return str(local_nginx)
 
         # Fall back to system nginx
-        try:
-            result = subprocess.run(
-                ["which", "nginx"],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            return result.stdout.strip()
-        except subprocess.CalledProcessError:
+        nginx_path = shutil.which("nginx")
+        if nginx_path is None:
             raise FileNotFoundError("nginx not found. Install with: make install-nginx")
+        return nginx_path
 
     def _create_uvicorn_log_config(self, log_file_path: Path) -> Path:
         """Create uvicorn logging configuration file.
@@ -279,21 +397,14 @@ class ServerManager:
         Returns:
             Started process
         """
-        env = os.environ.copy()
-
-        env["ENABLED_MODULES"] = ",".join(modules)
+        env = {**self._base_env, "ENABLED_MODULES": ",".join(modules)}
 
         # Create log file path and uvicorn logging config
         log_file_path = self.log_dir / f"{name}.log"
         log_config_path = self._create_uvicorn_log_config(log_file_path)
 
         cmd = [
-            sys.executable,
-            "-m",
-            "uvicorn",
-            "trading_api.main:app",
-            "--host",
-            "127.0.0.1",
+            *self._base_cmd,
             "--port",
             str(port),
             "--log-config",
@@ -301,30 +412,7 @@ class ServerManager:
         ]
 
         if reload:
-            cmd.append("--reload")
-            # Exclude generated files and management scripts to prevent reload loops
-            cmd.extend(
-                [
-                    "--reload-exclude",
-                    "*/openapi.json",
-                    "--reload-exclude",
-                    "*/asyncapi.json",
-                    "--reload-exclude",
-                    "*/clients/*",
-                    "--reload-exclude",
-                    "*/ws_generated/*",
-                    "--reload-exclude",
-                    "*/.local/*",
-                    "--reload-exclude",
-                    "*/.pids/*",
-                    "--reload-exclude",
-                    "*/scripts/*",
-                    "--reload-exclude",
-                    "*/__pycache__/*",
-                    "--reload-exclude",
-                    "*.pyc",
-                ]
-            )
+            cmd.extend(self._reload_args)
 
         logger.info(
             f"Starting {name} on port {port} with modules: {modules or 'none (core only)'}"
@@ -352,10 +440,8 @@ class ServerManager:
         Returns:
             Started nginx process (may become invalid after nginx daemonizes)
         """
-        nginx_binary = self._get_nginx_binary()
-
         cmd = [
-            nginx_binary,
+            self.nginx_binary,
             "-c",
             str(self.nginx_config_path.absolute()),
         ]
@@ -393,13 +479,95 @@ class ServerManager:
         except (ValueError, OSError):
             return None
 
+    def _read_all_pids(self) -> dict[str, int]:
+        """Read every instance PID file in a single directory scan.
+
+        Returns:
+            Mapping of instance name to PID (unreadable or invalid files are
+            skipped)
+        """
+        pids: dict[str, int] = {}
+        try:
+            with os.scandir(self.pid_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(".pid") or not entry.is_file():
+                        continue
+                    try:
+                        with open(entry.path, "rb") as f:
+                            pids[entry.name[: -len(".pid")]] = int(f.read())
+                    except (ValueError, OSError):
+                        continue
+        except OSError:
+            pass
+        return pids
+
+    def _owned_process(self, pid: int) -> subprocess.Popen[bytes] | None:
+        """Find a child process started by this manager.
+
+        Args:
+            pid: Process ID
+
+        Returns:
+            The Popen object for pid, or None if this manager did not start it
+        """
+        for process in self.processes.values():
+            if process.pid == pid:
+                return process
+        return None
+
     def _is_process_running(self, pid: int) -> bool:
+        # Our own children are checked via Popen.poll(), which reaps an exited
+        # child instead of reporting its zombie (or a reused PID) as running
+        process = self._owned_process(pid)
+        if process is not None:
+            return process.poll() is None
+
         try:
             os.kill(pid, 0)  # Signal 0 just checks if process exists
             return True
         except (OSError, ProcessLookupError):
             return False
 
+    def _wait_for_exit(self, pid: int, timeout: float) -> bool:
+        """Wait for a process to exit.
+
+        Waits on a pidfd (Linux 5.3+), which becomes readable the moment the
+        process exits, and falls back to polling where pidfds are unavailable.
+
+        Args:
+            pid: Process ID
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            True if the process exited within the timeout, False otherwise
+        """
+        process = self._owned_process(pid)
+        if process is not None:
+            try:
+                process.wait(timeout=timeout)
+                return True
+            except subprocess.TimeoutExpired:
+                return False
+
+        try:
+            pidfd = os.pidfd_open(pid)
+        except ProcessLookupError:
+            return True
+        except (AttributeError, OSError):
+            deadline = time.monotonic() + timeout
+            while time.monotonic() < deadline:
+                if not self._is_process_running(pid):
+                    return True
+                time.sleep(0.05)
+            return not self._is_process_running(pid)
+
+        try:
+            poller = select.poll()
+            poller.register(pidfd, select.POLLIN)
+            return bool(poller.poll(timeout * 1000))
+        finally:
+            os.close(pidfd)
+
     async def _force_kill_port_holders(self, ports: list[int]) -> None:
         # Step 1: Try SIGTERM first (graceful)
         terminated_any = False
@@ -436,7 +604,7 @@ class ServerManager:
             await asyncio.sleep(1.0)
 
             # Check which ports are still in use
-            remaining_ports = [port for port in ports if is_port_in_use(port)]
+            remaining_ports = await find_ports_in_use(ports)
 
             if not remaining_ports:
                 logger.info("All ports freed after SIGTERM")
@@ -483,13 +651,16 @@ class ServerManager:
             await asyncio.sleep(0.3)
 
     async def _check_module_health(
-        self, port: int, modules: list[str]
+        self, port: int, modules: list[str], client: httpx.AsyncClient
     ) -> dict[str, Any]:
         """Check health of all modules on a server instance.
 
+        Modules are probed concurrently over the shared client.
+
         Args:
             port: Server port
             modules: List of module names to check
+            client: HTTP client shared across health checks
 
         Returns:
             Dictionary with module health details:
@@ -507,55 +678,54 @@ class ServerManager:
             }
         """
         base_url = f"http://127.0.0.1:{port}"
-        module_health: dict[str, Any] = {}
-        all_healthy = True
 
-        async with httpx.AsyncClient() as client:
-            for module_name in modules:
-                health_url = f"{base_url}/api/v1/{module_name}/health"
-
-                try:
-                    start_time = time.time()
-                    response = await client.get(health_url, timeout=2.0)
-                    response_time = (time.time() - start_time) * 1000
-
-                    if response.status_code == 200:
-                        data = response.json()
-                        module_health[module_name] = {
-                            "healthy": True,
-                            "url": health_url,
-                            "api_version": data.get("api_version", "unknown"),
-                            "response_time_ms": round(response_time, 2),
-                        }
-                    else:
-                        module_health[module_name] = {
-                            "healthy": False,
-                            "url": health_url,
-                            "status_code": response.status_code,
-                        }
-                        all_healthy = False
-
-                except Exception as e:
-                    module_health[module_name] = {
-                        "healthy": False,
+        async def check_module(module_name: str) -> dict[str, Any]:
+            health_url = f"{base_url}/api/v1/{module_name}/health"
+
+            try:
+                start_time = time.time()
+                response = await client.get(health_url, timeout=2.0)
+                response_time = (time.time() - start_time) * 1000
+
+                if response.status_code == 200:
+                    data = response.json()
+                    return {
+                        "healthy": True,
                         "url": health_url,
-                        "error": str(e),
+                        "api_version": data.get("api_version", "unknown"),
+                        "response_time_ms": round(response_time, 2),
                     }
-                    all_healthy = False
+                return {
+                    "healthy": False,
+                    "url": health_url,
+                    "status_code": response.status_code,
+                }
+
+            except Exception as e:
+                return {
+                    "healthy": False,
+                    "url": health_url,
+                    "error": str(e),
+                }
+
+        results = await asyncio.gather(*(check_module(name) for name in modules))
+        module_health = dict(zip(modules, results))
+        all_healthy = all(result["healthy"] for result in results)
 
         return {"overall_healthy": all_healthy, "modules": module_health}
 
     async def _wait_for_ports_release(
         self, max_wait: float = 2.0, max_retries: int = 3
     ) -> None:
-        all_ports = [port for _, port in self.config.get_all_ports()]
+        # Ports seen free stay free, so only ports still held are re-probed
+        ports_in_use = list(self._all_ports)
 
         for retry in range(max_retries):
-            start_time = time.time()
+            deadline = time.monotonic() + max_wait
 
             # Wait for ports to be released
-            while time.time() - start_time < max_wait:
-                ports_in_use = [port for port in all_ports if is_port_in_use(port)]
+            while time.monotonic() < deadline:
+                ports_in_use = await find_ports_in_use(ports_in_use)
 
                 if not ports_in_use:
                     if retry > 0:
@@ -567,7 +737,7 @@ class ServerManager:
                 await asyncio.sleep(0.1)
 
             # Check which ports are still in use
-            ports_in_use = [port for port in all_ports if is_port_in_use(port)]
+            ports_in_use = await find_ports_in_use(ports_in_use)
 
             if not ports_in_use:
                 logger.debug("All ports released")
@@ -584,7 +754,8 @@ class ServerManager:
             await asyncio.sleep(0.5)
 
             # Check if ports are now released
-            remaining_ports = [port for port in all_ports if is_port_in_use(port)]
+            remaining_ports = await find_ports_in_use(ports_in_use)
+            ports_in_use = remaining_ports
 
             if not remaining_ports:
                 logger.info(f"All ports released after force kill (retry {retry + 1})")
@@ -610,18 +781,15 @@ class ServerManager:
         try:
             # Try graceful shutdown
             os.kill(pid, signal.SIGTERM)
-            start_time = time.time()
 
-            while time.time() - start_time < timeout:
-                if not self._is_process_running(pid):
-                    logger.info(f"{name} stopped gracefully")
-                    return
-                time.sleep(0.1)  # Check more frequently
+            if self._wait_for_exit(pid, timeout):
+                logger.info(f"{name} stopped gracefully")
+                return
 
             # Force kill if timeout exceeded
             logger.warning(f"{name} did not stop gracefully, force killing")
             os.kill(pid, signal.SIGKILL)
-            time.sleep(0.2)  # Wait for OS to clean up resources
+            self._wait_for_exit(pid, 0.2)  # Wait for OS to clean up resources
 
         except (OSError, ProcessLookupError) as e:
             logger.warning(f"Error stopping {name}: {e}")
@@ -637,24 +805,17 @@ class ServerManager:
             # Send QUIT signal for graceful shutdown
             os.kill(nginx_pid, signal.SIGQUIT)
 
-            start_time = time.time()
-            while time.time() - start_time < timeout:
-                # Check if process is still running
-                try:
-                    os.kill(nginx_pid, 0)  # Check if process exists
-                    time.sleep(0.05)  # Check more frequently
-                except OSError:
-                    # Process no longer exists
-                    logger.info("nginx stopped gracefully")
-                    # Clean up PID file if it still exists
-                    if self.nginx_pid_file.exists():
-                        self.nginx_pid_file.unlink()
-                    return
+            if self._wait_for_exit(nginx_pid, timeout):
+                logger.info("nginx stopped gracefully")
+                # Clean up PID file if it still exists
+                if self.nginx_pid_file.exists():
+                    self.nginx_pid_file.unlink()
+                return
 
             # Timeout - force kill
             logger.warning("nginx did not stop gracefully, force killing")
             os.kill(nginx_pid, signal.SIGKILL)
-            time.sleep(0.1)  # Brief wait for cleanup
+            self._wait_for_exit(nginx_pid, 0.1)  # Brief wait for cleanup
             if self.nginx_pid_file.exists():
                 self.nginx_pid_file.unlink()
             logger.info("nginx force killed")
@@ -673,62 +834,64 @@ class ServerManager:
             return False
 
         # Start all server instances
-        for server_name, server_config in self.config.servers.items():
-            for instance_idx in range(server_config.instances):
-                port = server_config.port + instance_idx
-                instance_name = f"{server_name}-{instance_idx}"
-
-                try:
-                    process = self._start_server_instance(
-                        instance_name,
-                        port,
-                        server_config.modules,
-                        server_config.reload,
-                    )
-                    self.processes[instance_name] = process
-
-                except Exception as e:
-                    logger.error(f"Failed to start {instance_name}: {e}")
-                    await self.stop_all()
-                    return False
+        for _, instance_name, port, server_config in self._instances:
+            try:
+                process = self._start_server_instance(
+                    instance_name,
+                    port,
+                    server_config.modules,
+                    server_config.reload,
+                )
+                self.processes[instance_name] = process
 
-        # Wait for all servers to become healthy
-        logger.info("Waiting for all servers to become healthy...")
-        all_healthy = True
+            except Exception as e:
+                logger.error(f"Failed to start {instance_name}: {e}")
+                await self.stop_all()
+                return False
 
-        for server_name, server_config in self.config.servers.items():
-            for instance_idx in range(server_config.instances):
-                port = server_config.port + instance_idx
-                instance_name = f"{server_name}-{instance_idx}"
-                base_url = f"http://127.0.0.1:{port}"
+        # Wait for all servers to become healthy (all instances concurrently),
+        # then start nginx; one client serves every health check of the startup
+        async with httpx.AsyncClient() as client:
+            logger.info("Waiting for all servers to become healthy...")
+            results = await asyncio.gather(
+                *(
+                    wait_for_health(
+                        f"http://127.0.0.1:{port}",
+                        modules=server_config.modules,
+                        client=client,
+                    )
+                    for _, _, port, server_config in self._instances
+                )
+            )
 
-                healthy = await wait_for_health(base_url, modules=server_config.modules)
+            all_healthy = True
+            for (_, instance_name, _, _), healthy in zip(self._instances, results):
                 if not healthy:
                     logger.error(f"{instance_name} failed to become healthy")
                     all_healthy = False
 
-        if not all_healthy:
-            logger.error("Not all servers became healthy - shutting down")
-            await self.stop_all()
-            return False
+            if not all_healthy:
+                logger.error("Not all servers became healthy - shutting down")
+                await self.stop_all()
+                return False
 
-        # Start nginx
-        try:
-            self._start_nginx()
-            logger.info("Nginx started successfully")
-        except Exception as e:
-            logger.error(f"Failed to start nginx: {e}")
-            await self.stop_all()
-            return False
-
-        # Wait for nginx to become healthy
-        # Check nginx by probing first available module through it
-        nginx_url = f"http://127.0.0.1:{self.config.nginx.port}"
-        # Get first server's modules for nginx health check
-        first_server_modules = next(iter(self.config.servers.values())).modules
-        nginx_healthy = await wait_for_health(
-            nginx_url, modules=first_server_modules[:1]
-        )  # Check just first module
+            # Start nginx
+            try:
+                self._start_nginx()
+                logger.info("Nginx started successfully")
+            except Exception as e:
+                logger.error(f"Failed to start nginx: {e}")
+                await self.stop_all()
+                return False
+
+            # Wait for nginx to become healthy
+            # Check nginx by probing first available module through it
+            nginx_url = f"http://127.0.0.1:{self.config.nginx.port}"
+            # Get first server's modules for nginx health check
+            first_server_modules = next(iter(self.config.servers.values())).modules
+            nginx_healthy = await wait_for_health(
+                nginx_url, modules=first_server_modules[:1], client=client
+            )  # Check just first module
 
         if not nginx_healthy:
             logger.error("Nginx failed to become healthy - shutting down")
@@ -748,20 +911,27 @@ class ServerManager:
                 nginx_pid = int(self.nginx_pid_file.read_text().strip())
                 if self._is_process_running(nginx_pid):
                     logger.info(f"Stopping nginx (PID: {nginx_pid})...")
-                    self._stop_process(nginx_pid, "nginx", timeout)
+                    await asyncio.to_thread(
+                        self._stop_process, nginx_pid, "nginx", timeout
+                    )
                 self.nginx_pid_file.unlink()
             except (ValueError, OSError) as e:
                 logger.warning(f"Failed to stop nginx: {e}")
 
-        # Step 2: Stop server instances
-        for server_name, server_config in self.config.servers.items():
-            for instance_idx in range(server_config.instances):
-                instance_name = f"{server_name}-{instance_idx}"
-                pid = self._read_pid_file(instance_name)
+        # Step 2: Stop server instances, all at once so that shutdown takes as
+        # long as the slowest instance rather than the sum of all of them
+        pids = self._read_all_pids()
+        stops = []
+        for _, instance_name, _, _ in self._instances:
+            pid = pids.get(instance_name)
+
+            if pid and self._is_process_running(pid):
+                logger.info(f"Stopping {instance_name} (PID: {pid})...")
+                stops.append(
+                    asyncio.to_thread(self._stop_process, pid, instance_name, timeout)
+                )
 
-                if pid and self._is_process_running(pid):
-                    logger.info(f"Stopping {instance_name} (PID: {pid})...")
-                    self._stop_process(pid, instance_name, timeout)
+        await asyncio.gather(*stops)
 
         logger.info("All processes stopped")
 
@@ -780,59 +950,69 @@ class ServerManager:
             try:
                 nginx_pid = int(self.nginx_pid_file.read_text().strip())
                 if self._is_process_running(nginx_pid):
-                    nginx_port = self.config.nginx.port
-                    # Check nginx health by probing through it to first server's first module
-                    first_server_modules = next(
-                        iter(self.config.servers.values())
-                    ).modules
-                    nginx_health = await self._check_module_health(
-                        nginx_port, first_server_modules[:1]
-                    )
                     status["nginx"] = {
                         "running": True,
                         "pid": nginx_pid,
-                        "port": nginx_port,
-                        "healthy": nginx_health["overall_healthy"],
+                        "port": self.config.nginx.port,
+                        "healthy": False,
                     }
                     status["running"] = True
             except (ValueError, OSError):
                 pass
 
         # Check server instance statuses
-        for server_name, server_config in self.config.servers.items():
-            server_instances = []
-
-            for instance_idx in range(server_config.instances):
-                port = server_config.port + instance_idx
-                instance_name = f"{server_name}-{instance_idx}"
-                pid = self._read_pid_file(instance_name)
-
-                instance_info: dict[str, Any] = {
-                    "name": instance_name,
-                    "port": port,
-                    "configured_modules": server_config.modules,
-                    "running": False,
-                    "pid": None,
-                    "overall_healthy": False,
-                    "module_health": {},
-                }
+        running_instances: list[tuple[dict[str, Any], int, list[str]]] = []
+        pids = self._read_all_pids()
+        status["servers"] = {server_name: [] for server_name in self.config.servers}
+        for server_name, instance_name, port, server_config in self._instances:
+            pid = pids.get(instance_name)
+
+            instance_info: dict[str, Any] = {
+                "name": instance_name,
+                "port": port,
+                "configured_modules": server_config.modules,
+                "running": False,
+                "pid": None,
+                "overall_healthy": False,
+                "module_health": {},
+            }
 
-                if pid and self._is_process_running(pid):
-                    instance_info["running"] = True
-                    instance_info["pid"] = pid
+            if pid and self._is_process_running(pid):
+                instance_info["running"] = True
+                instance_info["pid"] = pid
+                running_instances.append((instance_info, port, server_config.modules))
 
-                    # Check health of all modules
-                    health_result = await self._check_module_health(
-                        port, server_config.modules
-                    )
-                    instance_info["overall_healthy"] = health_result["overall_healthy"]
-                    instance_info["module_health"] = health_result["modules"]
+                status["running"] = True
 
-                    status["running"] = True
+            status["servers"][server_name].append(instance_info)
 
-                server_instances.append(instance_info)
+        # Check health of nginx and all running instances concurrently
+        async with httpx.AsyncClient() as client:
+            instance_health = asyncio.gather(
+                *(
+                    self._check_module_health(port, modules, client)
+                    for _, port, modules in running_instances
+                )
+            )
 
-            status["servers"][server_name] = server_instances
+            if status["nginx"]["running"]:
+                # Check nginx health by probing through it to first server's first module
+                first_server_modules = next(iter(self.config.servers.values())).modules
+                nginx_health, health_results = await asyncio.gather(
+                    self._check_module_health(
+                        self.config.nginx.port, first_server_modules[:1], client
+                    ),
+                    instance_health,
+                )
+                status["nginx"]["healthy"] = nginx_health["overall_healthy"]
+            else:
+                health_results = await instance_health
+
+        for (instance_info, _, _), health_result in zip(
+            running_instances, health_results
+        ):
+            instance_info["overall_healthy"] = health_result["overall_healthy"]
+            instance_info["module_health"] = health_result["modules"]
 
         return status
 
@@ -866,6 +1046,14 @@ class ServerManager:
 # ============================================================================
 
 
+# proxy_set_header lines shared by every REST and WebSocket location block
+_PROXY_HEADERS = """\
+            proxy_set_header Host $host;
+            proxy_set_header X-Real-IP $remote_addr;
+            proxy_set_header X-Forwarded-For $proxy_add_x_forwarded_for;
+            proxy_set_header X-Forwarded-Proto $scheme;"""
+
+
 def generate_upstream_blocks(config: DeploymentConfig) -> str:
     """Generate nginx upstream blocks for all servers.
 
@@ -875,21 +1063,19 @@ def generate_upstream_blocks(config: DeploymentConfig) -> str:
     Returns:
         Nginx upstream configuration blocks
     """
-    upstreams = []
+    # Single flat accumulator joined once (no per-server intermediate joins)
+    parts: list[str] = []
 
     for server_name, server_config in config.servers.items():
-        # Create upstream block for this server
-        upstream_servers = []
+        if parts:
+            parts.append("\n\n")
+        parts.append(f"    upstream {server_name}_backend {{\n")
         for instance_idx in range(server_config.instances):
             port = server_config.port + instance_idx
-            upstream_servers.append(f"        server 127.0.0.1:{port};")
+            parts.append(f"        server 127.0.0.1:{port};\n")
+        parts.append("    }")
 
-        upstream_block = f"""    upstream {server_name}_backend {{
-{chr(10).join(upstream_servers)}
-    }}"""
-        upstreams.append(upstream_block)
-
-    return "\n\n".join(upstreams)
+    return "".join(parts)
 
 
 def generate_rest_location_blocks(config: DeploymentConfig) -> str:
@@ -923,30 +1109,22 @@ def generate_rest_location_blocks(config: DeploymentConfig) -> str:
             module_location = f"""        # {module.capitalize()} module endpoints
         location {config.api_base_url}/{module}/ {{
             proxy_pass http://{server_name}_backend;
-            proxy_set_header Host $host;
-            proxy_set_header X-Real-IP $remote_addr;
-            proxy_set_header X-Forwarded-For $proxy_add_x_forwarded_for;
-            proxy_set_header X-Forwarded-Proto $scheme;
+{_PROXY_HEADERS}
         }}"""
             locations.append(module_location)
 
     return "\n\n".join(locations)
 
 
-def generate_websocket_location_block(config: DeploymentConfig) -> str:
-    """Generate nginx location block for WebSocket routing.
-
-    For query parameter routing, we route based on the 'type' query parameter
-    which is extracted from the WebSocket upgrade request.
-
-    For path-based routing, we route based on the module path in the URL
-    (e.g., /api/v1/broker/ws, /api/v1/datafeed/ws).
+def _generate_websocket_blocks(config: DeploymentConfig) -> tuple[str, str]:
+    """Generate the nginx WebSocket map block and location block(s) separately.
 
     Args:
         config: Deployment configuration
 
     Returns:
-        Nginx WebSocket location configuration
+        Tuple of (map_block, location_blocks); map_block is empty for
+        path-based routing
     """
     if config.websocket.routing_strategy == "query_param":
         # Build map directive for WebSocket routing
@@ -968,15 +1146,12 @@ def generate_websocket_location_block(config: DeploymentConfig) -> str:
             proxy_http_version 1.1;
             proxy_set_header Upgrade $http_upgrade;
             proxy_set_header Connection "upgrade";
-            proxy_set_header Host $host;
-            proxy_set_header X-Real-IP $remote_addr;
-            proxy_set_header X-Forwarded-For $proxy_add_x_forwarded_for;
-            proxy_set_header X-Forwarded-Proto $scheme;
+{_PROXY_HEADERS}
             proxy_read_timeout 3600s;
             proxy_send_timeout 3600s;
         }}"""
 
-        return map_block + "\n\n" + location_block
+        return map_block, location_block
     else:
         # Path-based routing: /api/v1/{module}/ws -> {server}_backend
         locations = []
@@ -987,39 +1162,109 @@ def generate_websocket_location_block(config: DeploymentConfig) -> str:
             proxy_http_version 1.1;
             proxy_set_header Upgrade $http_upgrade;
             proxy_set_header Connection "upgrade";
-            proxy_set_header Host $host;
-            proxy_set_header X-Real-IP $remote_addr;
-            proxy_set_header X-Forwarded-For $proxy_add_x_forwarded_for;
-            proxy_set_header X-Forwarded-Proto $scheme;
+{_PROXY_HEADERS}
             proxy_read_timeout 3600s;
             proxy_send_timeout 3600s;
         }}"""
             locations.append(location)
 
-        return "\n\n".join(locations)
+        return "", "\n\n".join(locations)
 
 
-def generate_nginx_config(
-    config: DeploymentConfig, output_file: TextIO, pid_file: Path | None = None
-) -> None:
-    """Generate complete nginx configuration.
+def generate_websocket_location_block(config: DeploymentConfig) -> str:
+    """Generate nginx location block for WebSocket routing.
+
+    For query parameter routing, we route based on the 'type' query parameter
+    which is extracted from the WebSocket upgrade request.
+
+    For path-based routing, we route based on the module path in the URL
+    (e.g., /api/v1/broker/ws, /api/v1/datafeed/ws).
+
+    Args:
+        config: Deployment configuration
+
+    Returns:
+        Nginx WebSocket location configuration
+    """
+    map_block, location_blocks = _generate_websocket_blocks(config)
+    if map_block:
+        return map_block + "\n\n" + location_blocks
+    return location_blocks
+
+
+NGINX_CONFIG_HASH_PREFIX = "# config-hash: "
+
+
+@cache
+def _nginx_generator_digest() -> str:
+    """Hash of this module's source, which holds the nginx config templates.
+
+    Returns:
+        Hex digest of the generator source
+    """
+    return hashlib.blake2b(Path(__file__).read_bytes(), digest_size=16).hexdigest()
+
+
+def nginx_config_digest(config: DeploymentConfig, pid_file: Path | None = None) -> str:
+    """Compute a stable fingerprint of the inputs of a generated nginx config.
+
+    Covers the deployment configuration, the PID file path and the generator
+    source, so edits to the templates (e.g. _PROXY_HEADERS) also invalidate
+    previously generated configs.
+
+    Args:
+        config: Deployment configuration
+        pid_file: Optional custom PID file path (defaults to backend_dir/nginx.pid)
+
+    Returns:
+        Hex digest identifying the configuration
+    """
+    if pid_file is None:
+        pid_file = Path(__file__).parent.parent / ".local" / "nginx.pid"
+
+    payload = (
+        f"{config.model_dump_json()}|{pid_file.resolve()}|{_nginx_generator_digest()}"
+    )
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def read_nginx_config_digest(config_path: Path) -> str | None:
+    """Read the config hash recorded in a generated nginx config header.
+
+    Args:
+        config_path: Path to nginx configuration file
+
+    Returns:
+        Recorded digest, or None if the file is missing or has no hash header
+    """
+    try:
+        with open(config_path, "rb") as f:
+            head = f.read(256)
+    except OSError:
+        return None
+
+    first_line = head.split(b"\n", 1)[0].decode("utf-8", "replace")
+    if not first_line.startswith(NGINX_CONFIG_HASH_PREFIX):
+        return None
+    return first_line[len(NGINX_CONFIG_HASH_PREFIX) :].strip()
+
+
+def render_nginx_config(config: DeploymentConfig, pid_file: Path | None = None) -> str:
+    """Render complete nginx configuration.
 
     Args:
         config: Deployment configuration
-        output_file: Output file handle
         pid_file: Optional custom PID file path (defaults to backend_dir/nginx.pid)
+
+    Returns:
+        Complete nginx configuration text
     """
     # Generate all configuration sections
     upstreams = generate_upstream_blocks(config)
     rest_locations = generate_rest_location_blocks(config)
 
     # WebSocket routing includes map directive if using query params
-    ws_config = generate_websocket_location_block(config)
-    if config.websocket.routing_strategy == "query_param":
-        ws_map, ws_location = ws_config.split("\n\n", 1)
-    else:
-        ws_map = ""
-        ws_location = ws_config
+    ws_map, ws_location = _generate_websocket_blocks(config)
 
     # Worker processes configuration
     worker_processes = (
@@ -1048,6 +1293,8 @@ def generate_nginx_config(
     # Ensure temp directory exists
     temp_dir.mkdir(parents=True, exist_ok=True)
 
+    config_digest = nginx_config_digest(config, pid_file=pid_file)
+
     # Convert all paths to absolute paths (nginx needs absolute paths)
     pid_file = pid_file.resolve()
     access_log = access_log.resolve()
@@ -1056,7 +1303,8 @@ def generate_nginx_config(
     proxy_temp = proxy_temp.resolve()
 
     # Generate complete configuration
-    nginx_config = f"""# Auto-generated nginx configuration for multi-process backend
+    nginx_config = f"""{NGINX_CONFIG_HASH_PREFIX}{config_digest}
+# Auto-generated nginx configuration for multi-process backend
 # Generated from deployment configuration
 # DO NOT EDIT MANUALLY - regenerate using backend-manager gen-nginx-conf
 
@@ -1099,7 +1347,40 @@ http {{
 }}
 """
 
-    output_file.write(nginx_config)
+    return nginx_config
+
+
+def generate_nginx_config(
+    config: DeploymentConfig, output_file: TextIO, pid_file: Path | None = None
+) -> None:
+    """Generate complete nginx configuration.
+
+    Args:
+        config: Deployment configuration
+        output_file: Output file handle
+        pid_file: Optional custom PID file path (defaults to backend_dir/nginx.pid)
+    """
+    output_file.write(render_nginx_config(config, pid_file=pid_file))
+
+
+def write_nginx_config(
+    config: DeploymentConfig, output_path: Path, pid_file: Path | None = None
+) -> None:
+    """Render nginx configuration and write it to disk in a single syscall.
+
+    The whole config is encoded once and handed to os.write() on a raw file
+    descriptor, bypassing the TextIOWrapper/BufferedWriter layers.
+
+    Args:
+        config: Deployment configuration
+        output_path: Destination nginx configuration file
+        pid_file: Optional custom PID file path (defaults to backend_dir/nginx.pid)
+
+    Raises:
+        OSError: If the file cannot be opened or written
+    """
+    blob = render_nginx_config(config, pid_file=pid_file).encode("utf-8")
+    write_file_bytes(output_path, blob)
 
 
 def validate_nginx_config(config_path: Path) -> bool:
@@ -1117,24 +1398,28 @@ def validate_nginx_config(config_path: Path) -> bool:
 
     # Check for local nginx binary first
     local_nginx = Path(__file__).parent.parent / ".local" / "bin" / "nginx"
-    nginx_cmd = str(local_nginx) if local_nginx.exists() else "nginx"
+    nginx_cmd = str(local_nginx) if local_nginx.exists() else shutil.which("nginx")
 
     try:
-        abs_config_path = config_path.resolve()
+        if nginx_cmd is None:
+            raise FileNotFoundError("nginx")
+
+        # nginx does not need symlinks resolved: absolute() avoids the stat walk
+        abs_config_path = str(config_path.absolute())
+        # Capture raw bytes; output is decoded only where it is logged
         result = subprocess.run(
-            [nginx_cmd, "-t", "-c", str(abs_config_path)],
+            [nginx_cmd, "-t", "-c", abs_config_path],
             capture_output=True,
-            text=True,
             check=False,
         )
 
         if result.returncode == 0:
             logger.info(f"✅ Nginx configuration is valid: {abs_config_path}")
-            logger.info(result.stderr.strip())
+            logger.info(result.stderr.decode("utf-8", "replace").strip())
             return True
         else:
             logger.error(f"❌ Nginx configuration validation failed")
-            logger.error(result.stderr.strip())
+            logger.error(result.stderr.decode("utf-8", "replace").strip())
             return False
 
     except FileNotFoundError:
@@ -1150,26 +1435,35 @@ def validate_nginx_config(config_path: Path) -> bool:
 # ============================================================================
 
 
-async def cmd_start(args: argparse.Namespace) -> int:
+async def cmd_start(
+    args: argparse.Namespace, config: DeploymentConfig | None = None
+) -> int:
     """Start multi-process backend.
 
     Args:
         args: Parsed command-line arguments
+        config: Already-loaded deployment configuration (loaded from
+            args.config if not provided)
 
     Returns:
         Exit code (0 for success, 1 for failure)
     """
     # Load deployment configuration
-    try:
-        config = load_config(args.config)
-        logger.info(f"Loaded configuration from {args.config}")
-    except Exception as e:
-        logger.error(f"Failed to load configuration: {e}")
-        return 1
+    if config is None:
+        try:
+            config = load_config(args.config)
+            logger.info(f"Loaded configuration from {args.config}")
+        except Exception as e:
+            logger.error(f"Failed to load configuration: {e}")
+            return 1
 
     # Create and run server manager (always runs in detached mode)
-    # The ServerManager handles nginx config generation internally
     manager = ServerManager(config)
+    try:
+        manager.prepare_nginx_config(regenerate=args.generate_nginx)
+    except ValueError as e:
+        logger.error(f"Cannot start backend: {e}")
+        return 1
 
     logger.info("=" * 60)
     logger.info("Starting multi-process backend (detached mode)...")
@@ -1193,22 +1487,27 @@ async def cmd_start(args: argparse.Namespace) -> int:
     return await manager.run()
 
 
-async def cmd_stop(args: argparse.Namespace) -> int:
+async def cmd_stop(
+    args: argparse.Namespace, config: DeploymentConfig | None = None
+) -> int:
     """Stop running backend processes.
 
     Args:
         args: Parsed command-line arguments
+        config: Already-loaded deployment configuration (loaded from
+            args.config if not provided)
 
     Returns:
         Exit code (0 for success, 1 for failure)
     """
     # Load deployment configuration
-    try:
-        config = load_config(args.config)
-        logger.info(f"Loaded configuration from {args.config}")
-    except Exception as e:
-        logger.error(f"Failed to load configuration: {e}")
-        return 1
+    if config is None:
+        try:
+            config = load_config(args.config)
+            logger.info(f"Loaded configuration from {args.config}")
+        except Exception as e:
+            logger.error(f"Failed to load configuration: {e}")
+            return 1
 
     # Create server manager (without starting)
     manager = ServerManager(config)
@@ -1324,8 +1623,16 @@ async def cmd_restart(args: argparse.Namespace) -> int:
     """
     logger.info("Restarting backend...")
 
+    # Load configuration once and share it between stop and start
+    try:
+        config = load_config(args.config)
+        logger.info(f"Loaded configuration from {args.config}")
+    except Exception as e:
+        logger.error(f"Failed to load configuration: {e}")
+        return 1
+
     # Stop first
-    stop_result = await cmd_stop(args)
+    stop_result = await cmd_stop(args, config=config)
     if stop_result != 0:
         logger.error("Failed to stop backend")
         return 1
@@ -1334,7 +1641,7 @@ async def cmd_restart(args: argparse.Namespace) -> int:
     # No manual sleep needed
 
     # Start
-    start_result = await cmd_start(args)
+    start_result = await cmd_start(args, config=config)
     if start_result != 0:
         logger.error("Failed to start backend")
         return 1
@@ -1362,8 +1669,7 @@ def cmd_gen_nginx_conf(args: argparse.Namespace) -> int:
 
     # Generate nginx configuration
     try:
-        with open(args.output, "w") as f:
-            generate_nginx_config(config, f)
+        write_nginx_config(config, args.output)
         logger.info(f"✅ Generated nginx configuration: {args.output}")
     except Exception as e:
         logger.error(f"❌ Failed to generate nginx configuration: {e}")
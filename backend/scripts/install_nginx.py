@@ -11,6 +11,9 @@ Usage:
     python scripts/install_nginx.py
     python scripts/install_nginx.py --version 1.26.x
     python scripts/install_nginx.py --check-only
+    python scripts/install_nginx.py --check-only --verify
+    python scripts/install_nginx.py --fast
+    python scripts/install_nginx.py --force
 
 Features:
     - Auto-detects OS and architecture
@@ -20,14 +23,35 @@ Features:
 """
 
 import argparse
+import base64
+import datetime
 import hashlib
+import http.client
 import json
+import os
 import platform
+import stat
+import subprocess
 import sys
+import urllib.parse
 import urllib.request
 from pathlib import Path
 from typing import Optional
 
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:  # orjson is an optional speedup
+    _HAS_ORJSON = False
+
+# HTTP statuses answered with a Location to follow
+_REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+_MAX_REDIRECTS = 5
+
+# Read size for the binary download (1 MiB)
+_DOWNLOAD_CHUNK_SIZE = 1 << 20
+
 
 class NginxInstaller:
     """Installer for standalone nginx binary."""
@@ -35,15 +59,138 @@ class NginxInstaller:
     REPO_URL = "https://jirutka.github.io/nginx-binaries"
     INSTALL_DIR = Path(__file__).parent.parent / ".local" / "bin"
 
-    def __init__(self, version: str = "1.28.x"):
+    def __init__(
+        self, version: str = "1.28.x", fast: bool = False, force: bool = False
+    ):
         """Initialize installer.
 
         Args:
             version: Nginx version pattern (e.g., "1.28.x" for latest 1.28.x)
+            fast: Skip the SHA1 checksum when the binary is served over HTTPS
+                with a strong ETag
+            force: Download the binary even if the server reports it unchanged
         """
         self.version = version
+        self.fast = fast
+        self.force = force
         self.os_name = self._detect_os()
         self.arch = self._detect_arch()
+        self._conn: Optional[http.client.HTTPSConnection] = None
+        self._conn_host: Optional[str] = None
+
+    def close(self) -> None:
+        """Close the persistent HTTPS connection, if open."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+            self._conn_host = None
+
+    def _get_connection(self, host: str) -> http.client.HTTPSConnection:
+        """Get the keep-alive HTTPS connection for a host.
+
+        The index, binary and checksum all live on the same host, so they are
+        fetched over one TCP/TLS connection instead of a handshake each.
+
+        Args:
+            host: Host (and optional port) to connect to
+
+        Returns:
+            Connection to the host, opened lazily on first request
+        """
+        if self._conn is None or self._conn_host != host:
+            self.close()
+            self._conn = self._open_connection(host)
+            self._conn_host = host
+        return self._conn
+
+    def _open_connection(self, host: str) -> http.client.HTTPSConnection:
+        """Open an HTTPS connection, tunnelled through the configured proxy.
+
+        Honors HTTPS_PROXY/https_proxy and NO_PROXY/no_proxy like
+        urllib.request.urlopen: when a proxy applies, the connection goes to the
+        proxy and a CONNECT tunnel is set up to the target host.
+
+        Args:
+            host: Target host (and optional port)
+
+        Returns:
+            Unopened connection (it connects on the first request)
+        """
+        proxy = urllib.request.getproxies().get("https")
+        hostname = urllib.parse.urlsplit(f"//{host}").hostname or host
+        if not proxy or urllib.request.proxy_bypass(hostname):
+            return http.client.HTTPSConnection(host, timeout=30)
+
+        if "://" not in proxy:
+            proxy = f"http://{proxy}"
+        proxy_parts = urllib.parse.urlsplit(proxy)
+        tunnel_headers = {}
+        if proxy_parts.username is not None:
+            credentials = (
+                f"{urllib.parse.unquote(proxy_parts.username)}:"
+                f"{urllib.parse.unquote(proxy_parts.password or '')}"
+            )
+            token = base64.b64encode(credentials.encode()).decode("ascii")
+            tunnel_headers["Proxy-Authorization"] = f"Basic {token}"
+
+        # Proxy host[:port] without the credentials
+        proxy_host = proxy_parts.netloc.rpartition("@")[2]
+        conn = http.client.HTTPSConnection(proxy_host, timeout=30)
+        conn.set_tunnel(host, headers=tunnel_headers)
+        return conn
+
+    def _request(
+        self, url: str, headers: Optional[dict[str, str]] = None
+    ) -> http.client.HTTPResponse:
+        """Send a GET request over the persistent connection.
+
+        Follows redirects and raises on HTTP errors, like urllib.request.urlopen.
+        Other statuses (e.g. 304 Not Modified) are returned to the caller.
+        The caller must read the response body fully before the next request.
+
+        Args:
+            url: HTTPS URL to fetch
+            headers: Extra request headers (e.g. If-None-Match)
+
+        Returns:
+            Response with an unread body
+
+        Raises:
+            RuntimeError: On an HTTP error status or too many redirects
+        """
+        for _ in range(_MAX_REDIRECTS + 1):
+            parts = urllib.parse.urlsplit(url)
+            target = parts.path or "/"
+            if parts.query:
+                target += f"?{parts.query}"
+
+            conn = self._get_connection(parts.netloc)
+            try:
+                conn.request("GET", target, headers=headers or {})
+                response = conn.getresponse()
+            except (http.client.RemoteDisconnected, ConnectionError):
+                # The server dropped the idle keep-alive connection: retry once
+                conn.close()
+                conn.request("GET", target, headers=headers or {})
+                response = conn.getresponse()
+
+            if response.status in _REDIRECT_STATUSES:
+                location = response.getheader("Location")
+                response.read()
+                if not location:
+                    raise RuntimeError(f"Redirect without Location for {url}")
+                url = urllib.parse.urljoin(url, location)
+                continue
+
+            if response.status >= 400:
+                response.read()
+                raise RuntimeError(
+                    f"HTTP {response.status} {response.reason} for {url}"
+                )
+
+            return response
+
+        raise RuntimeError(f"Too many redirects for {url}")
 
     def _detect_os(self) -> str:
         """Detect current operating system.
@@ -87,26 +234,49 @@ class NginxInstaller:
     def _fetch_index(self) -> list[dict]:
         """Fetch repository index of available binaries.
 
+        The index is cached in INSTALL_DIR along with its ETag, which is sent
+        as If-None-Match so that an unchanged index is answered with a 304 and
+        read from the cache instead of being downloaded again.
+
         Returns:
             List of available binary metadata
         """
         index_url = f"{self.REPO_URL}/index.json"
+        cache_path = self.INSTALL_DIR / "index.json"
+        etag_path = self.INSTALL_DIR / "index.json.etag"
+
+        headers = {}
+        if cache_path.exists() and etag_path.exists():
+            headers["If-None-Match"] = etag_path.read_text().strip()
 
         try:
-            with urllib.request.urlopen(index_url) as response:
+            with self._request(index_url, headers=headers) as response:
                 data = response.read()
-                index_data = json.loads(data)
-
-                # The index has a 'contents' array
-                if isinstance(index_data, dict) and "contents" in index_data:
-                    return index_data["contents"]
-                elif isinstance(index_data, list):
-                    return index_data
+                if response.status == 304:
+                    data = cache_path.read_bytes()
+                    etag = None
                 else:
-                    raise ValueError(f"Unexpected index format: {type(index_data)}")
+                    etag = response.getheader("ETag")
+
+            index_data = orjson.loads(data) if _HAS_ORJSON else json.loads(data)
+
+            # The index has a 'contents' array
+            if isinstance(index_data, dict) and "contents" in index_data:
+                contents = index_data["contents"]
+            elif isinstance(index_data, list):
+                contents = index_data
+            else:
+                raise ValueError(f"Unexpected index format: {type(index_data)}")
         except Exception as e:
             raise RuntimeError(f"Failed to fetch nginx index: {e}")
 
+        if etag:
+            self.INSTALL_DIR.mkdir(parents=True, exist_ok=True)
+            cache_path.write_bytes(data)
+            etag_path.write_text(etag)
+
+        return contents
+
     def _find_latest_version(self, index: list[dict]) -> Optional[dict]:
         """Find the latest nginx version matching the pattern.
 
@@ -135,98 +305,141 @@ class NginxInstaller:
         major = int(parts[0]) if parts[0] != "x" else None
         minor = int(parts[1]) if len(parts) > 1 and parts[1] != "x" else None
 
-        # Filter by version pattern
-        if major is not None:
-            candidates = [e for e in candidates if e["version"].startswith(f"{major}.")]
-
-        if minor is not None:
-            candidates = [
-                e for e in candidates if e["version"].startswith(f"{major}.{minor}.")
-            ]
+        # Parse each candidate version once, then filter by the pattern
+        parsed = [
+            (tuple(int(p) for p in entry["version"].split(".")), entry)
+            for entry in candidates
+        ]
+        parsed = [
+            (version, entry)
+            for version, entry in parsed
+            if (major is None or version[0] == major)
+            and (minor is None or (len(version) > 1 and version[1] == minor))
+        ]
 
-        if not candidates:
+        if not parsed:
             return None
 
-        # Sort by version and return the latest
-        candidates.sort(
-            key=lambda x: tuple(map(int, x["version"].split("."))), reverse=True
-        )
-        return candidates[0]
+        # Return the latest version
+        return max(parsed, key=lambda version_entry: version_entry[0])[1]
 
-    def _download_binary(self, url: str, dest: Path) -> None:
-        """Download binary file with progress indication.
+    def _download_and_verify(
+        self, url: str, dest: Path, checksum_url: str, force: bool = False
+    ) -> bool:
+        """Download binary file with progress indication and verify its SHA1.
+
+        Bytes are hashed as they are written, so the binary is never read back
+        from disk; the small checksum file is fetched once the download is done.
+        In fast mode, an HTTPS download with a strong ETag is trusted as is and
+        the checksum is skipped.
+
+        The server's ETag for the binary is stored next to it, and sent back as
+        If-None-Match on the next run: when the installed binary is still
+        current the server answers 304 and nothing is transferred. With force,
+        the ETag is not sent and the binary is always downloaded again.
 
         Args:
             url: URL to download from
             dest: Destination file path
+            checksum_url: URL to SHA1 checksum file
+            force: Download even if the stored ETag says dest is current
+
+        Returns:
+            True if the binary was downloaded, False if dest is already current
+
+        Raises:
+            RuntimeError: If the download fails or the checksum does not match
         """
+        etag_path = dest.with_suffix(".etag")
+        headers = {}
+        if not force and dest.exists() and etag_path.exists():
+            headers["If-None-Match"] = etag_path.read_text().strip()
+
         print(f"Downloading from: {url}")
 
         try:
-            with urllib.request.urlopen(url) as response:
+            with self._request(url, headers=headers) as response:
+                if response.status == 304:
+                    response.read()
+                    return False
+
+                etag = response.getheader("ETag")
+                skip_checksum = (
+                    self.fast
+                    and etag is not None
+                    and not etag.startswith("W/")
+                    and urllib.parse.urlsplit(url).scheme == "https"
+                )
                 total_size = int(response.headers.get("content-length", 0))
                 downloaded = 0
-                chunk_size = 8192
+                sha1 = None if skip_checksum else hashlib.sha1()
+                last_percent = -1
+                # One reusable buffer serves the socket read, file write and hash
+                buffer = bytearray(_DOWNLOAD_CHUNK_SIZE)
+                view = memoryview(buffer)
 
                 dest.parent.mkdir(parents=True, exist_ok=True)
 
                 with open(dest, "wb") as f:
-                    while True:
-                        chunk = response.read(chunk_size)
-                        if not chunk:
-                            break
-
+                    while n := response.readinto(buffer):
+                        chunk = view[:n]
                         f.write(chunk)
-                        downloaded += len(chunk)
+                        if sha1 is not None:
+                            sha1.update(chunk)
+                        downloaded += n
 
+                        # Only redraw the progress line when the percentage changes
                         if total_size > 0:
-                            percent = (downloaded / total_size) * 100
-                            print(
-                                f"\rProgress: {percent:.1f}% ({downloaded}/{total_size} bytes)",
-                                end="",
-                            )
+                            percent = downloaded * 100 // total_size
+                            if percent != last_percent:
+                                last_percent = percent
+                                sys.stdout.write(
+                                    f"\rProgress: {percent}% ({downloaded}/{total_size} bytes)"
+                                )
+                                sys.stdout.flush()
 
                 print()  # New line after progress
 
         except Exception as e:
             if dest.exists():
                 dest.unlink()
+            etag_path.unlink(missing_ok=True)
             raise RuntimeError(f"Failed to download binary: {e}")
 
-    def _verify_checksum(self, binary_path: Path, checksum_url: str) -> bool:
-        """Verify downloaded binary checksum.
+        if sha1 is None:
+            print("⚡ Skipping checksum: integrity anchored on HTTPS + strong ETag")
+        elif (expected_checksum := self._fetch_checksum(checksum_url)) is not None:
+            actual_checksum = sha1.hexdigest()
+            if actual_checksum != expected_checksum:
+                print("❌ Checksum mismatch!")
+                print(f"   Expected: {expected_checksum}")
+                print(f"   Actual:   {actual_checksum}")
+                dest.unlink()
+                etag_path.unlink(missing_ok=True)
+                raise RuntimeError("Downloaded binary failed checksum verification")
+            print(f"✅ Checksum verified: {actual_checksum}")
+
+        if etag:
+            etag_path.write_text(etag)
+        else:
+            etag_path.unlink(missing_ok=True)
+        return True
+
+    def _fetch_checksum(self, checksum_url: str) -> Optional[str]:
+        """Fetch the expected SHA1 checksum of the binary.
 
         Args:
-            binary_path: Path to downloaded binary
             checksum_url: URL to SHA1 checksum file
 
         Returns:
-            True if checksum matches
+            Hex digest, or None if it could not be fetched
         """
         try:
-            # Download checksum
-            with urllib.request.urlopen(checksum_url) as response:
-                expected_checksum = response.read().decode().strip().split()[0]
-
-            # Calculate actual checksum
-            sha1 = hashlib.sha1()
-            with open(binary_path, "rb") as f:
-                while chunk := f.read(8192):
-                    sha1.update(chunk)
-            actual_checksum = sha1.hexdigest()
-
-            if actual_checksum != expected_checksum:
-                print(f"❌ Checksum mismatch!")
-                print(f"   Expected: {expected_checksum}")
-                print(f"   Actual:   {actual_checksum}")
-                return False
-
-            print(f"✅ Checksum verified: {actual_checksum}")
-            return True
-
+            with self._request(checksum_url) as response:
+                return response.read().decode().strip().split()[0]
         except Exception as e:
             print(f"⚠️  Warning: Could not verify checksum: {e}")
-            return True  # Continue anyway if checksum verification fails
+            return None  # Continue anyway if checksum verification fails
 
     def install(self) -> Path:
         """Install nginx binary.
@@ -263,28 +476,50 @@ class NginxInstaller:
         dest_filename = "nginx.exe" if self.os_name == "windows" else "nginx"
         dest_path = self.INSTALL_DIR / dest_filename
 
-        # Check if already installed
-        if dest_path.exists():
+        # Check if already installed. A confirmed overwrite revalidates the
+        # binary with its stored ETag; a missing or broken binary, or --force,
+        # downloads it in full
+        installed = self.check_installation() is not None
+        if installed:
             print(f"⚠️  nginx already installed at: {dest_path}")
             response = input("Overwrite? [y/N] ").strip().lower()
             if response != "y":
                 print("Installation cancelled.")
                 return dest_path
 
-        # Download binary
-        self._download_binary(binary_url, dest_path)
-
-        # Verify checksum
-        self._verify_checksum(dest_path, checksum_url)
+        # Download and verify binary (skipped when the server reports it unchanged)
+        force = self.force or not installed
+        if not self._download_and_verify(
+            binary_url, dest_path, checksum_url, force=force
+        ):
+            self._write_metadata(version)
+            print(f"✅ nginx {version} is already up to date at: {dest_path}")
+            return dest_path
 
         # Make executable (Unix-like systems)
         if self.os_name != "windows":
             dest_path.chmod(0o755)
 
+        # Record the version so --check-only does not have to run the binary
+        self._write_metadata(version)
+
         print(f"✅ nginx {version} installed to: {dest_path}")
 
         return dest_path
 
+    def _write_metadata(self, version: str) -> None:
+        """Record the installed nginx version in INSTALL_DIR/nginx.json.
+
+        Args:
+            version: Installed nginx version (e.g., "1.28.0")
+        """
+        metadata = {
+            "version": version,
+            "installed_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        }
+        metadata_path = self.INSTALL_DIR / "nginx.json"
+        metadata_path.write_text(json.dumps(metadata, indent=2))
+
     def check_installation(self) -> Optional[Path]:
         """Check if nginx is already installed.
 
@@ -294,9 +529,23 @@ class NginxInstaller:
         dest_filename = "nginx.exe" if self.os_name == "windows" else "nginx"
         dest_path = self.INSTALL_DIR / dest_filename
 
-        if dest_path.exists():
-            return dest_path
-        return None
+        try:
+            st = os.stat(dest_path)
+        except FileNotFoundError:
+            return None
+        return dest_path if stat.S_ISREG(st.st_mode) else None
+
+    def installed_version(self) -> Optional[str]:
+        """Read the nginx version recorded by the last install.
+
+        Returns:
+            Installed version (e.g., "1.28.0"), or None if not recorded
+        """
+        metadata_path = self.INSTALL_DIR / "nginx.json"
+        try:
+            return json.loads(metadata_path.read_text())["version"]
+        except (OSError, ValueError, KeyError):
+            return None
 
 
 def main() -> int:
@@ -314,19 +563,39 @@ def main() -> int:
         action="store_true",
         help="Only check if nginx is installed, don't install",
     )
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="With --check-only, run the binary instead of trusting recorded metadata",
+    )
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="Skip the SHA1 checksum when the binary is served with a strong ETag",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-download the binary even if the server reports it unchanged",
+    )
 
     args = parser.parse_args()
 
     try:
-        installer = NginxInstaller(version=args.version)
+        installer = NginxInstaller(
+            version=args.version, fast=args.fast, force=args.force
+        )
 
         if args.check_only:
             nginx_path = installer.check_installation()
             if nginx_path:
                 print(f"✅ nginx is installed at: {nginx_path}")
-                # Test execution
-                import subprocess
+                version = None if args.verify else installer.installed_version()
+                if version:
+                    print(f"nginx version: nginx/{version}")
+                    return 0
 
+                # Test execution
                 result = subprocess.run(
                     [str(nginx_path), "-v"],
                     capture_output=True,
@@ -340,12 +609,13 @@ def main() -> int:
                 return 1
 
         # Install nginx
-        nginx_path = installer.install()
+        try:
+            nginx_path = installer.install()
+        finally:
+            installer.close()
 
         # Test installation
         print("\n🧪 Testing nginx installation...")
-        import subprocess
-
         result = subprocess.run(
             [str(nginx_path), "-v"],
             capture_output=True,
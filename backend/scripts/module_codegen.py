@@ -1,64 +1,132 @@
 #!/usr/bin/env python3
-"""Generate specs and clients for a specific module.
+"""Generate specs and clients for one or more modules.
 
 This script is used by the Makefile 'generate' target to generate
-OpenAPI/AsyncAPI specs and Python clients for a module.
+OpenAPI/AsyncAPI specs and Python clients for the selected modules in a
+single process.
 """
+import importlib
 import sys
+import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from trading_api.shared.module_interface import ModuleApp
 
 # Add src to path for module imports
 sys.path.insert(0, str(Path.cwd() / "src"))
 
 
-def main() -> None:
-    """Generate specs and clients for the specified module."""
-    if len(sys.argv) < 2:
-        print("Usage: module_codegen.py <module_name> [output_dir]", file=sys.stderr)
-        sys.exit(1)
+def load_module_app(module_name: str) -> "ModuleApp":
+    """Import and instantiate a module wrapped in a ModuleApp.
 
-    module_name = sys.argv[1]
-    output_dir = Path(sys.argv[2]) if len(sys.argv) > 2 else None
+    Args:
+        module_name: Module package name (e.g., 'broker')
 
+    Returns:
+        ModuleApp for the module
+    """
     # Build module class name (e.g., 'broker' -> 'BrokerModule')
     module_class_name = (
         "".join(word.capitalize() for word in module_name.split("_")) + "Module"
     )
     module_path = f"trading_api.modules.{module_name}"
 
-    try:
-        # Import ModuleApp wrapper
-        from trading_api.shared.module_interface import ModuleApp
+    # Import ModuleApp wrapper
+    from trading_api.shared.module_interface import ModuleApp
 
-        # Import and instantiate module
-        module_pkg = __import__(module_path, fromlist=[module_class_name])
-        module_class = getattr(module_pkg, module_class_name)
+    # Import and instantiate module
+    module_pkg = importlib.import_module(module_path)
+    module_class = getattr(module_pkg, module_class_name)
 
-        # NOTE: WS routers are automatically generated during module instantiation!
-        # When module_class() is called, the module's __init__ creates WsRouters,
-        # which triggers generate_module_routers() to generate concrete router classes
-        # from TypeAlias declarations in the module's ws.py file.
-        module = module_class()
+    # NOTE: WS routers are automatically generated during module instantiation!
+    # When module_class() is called, the module's __init__ creates WsRouters,
+    # which triggers generate_module_routers() to generate concrete router classes
+    # from TypeAlias declarations in the module's ws.py file.
+    module = module_class()
 
-        # Create apps using ModuleApp wrapper
-        module_app = ModuleApp(module)
+    # Create apps using ModuleApp wrapper
+    return ModuleApp(module)
 
-        # Generate specs and clients
-        if output_dir:
-            print(f"📁 Using custom output directory: {output_dir}")
-            module_app.gen_specs_and_clients(clean_first=False, output_dir=output_dir)
-        else:
-            module_app.gen_specs_and_clients(clean_first=False)
 
-        print(f"✅ Successfully generated for {module_name}")
+def _fail(module_name: str, error: BaseException) -> None:
+    """Report a module failure and exit with status 1."""
+    print(f"❌ Failed for {module_name}: {error}", file=sys.stderr)
+    traceback.print_exception(error)
+    sys.exit(1)
 
-    except Exception as e:
-        print(f"❌ Failed for {module_name}: {e}", file=sys.stderr)
-        import traceback
 
-        traceback.print_exc()
+def main() -> None:
+    """Generate specs and clients for the specified modules.
+
+    Accepts a comma-separated module list so that several modules share a
+    single interpreter start-up and trading_api import. Modules are imported
+    one at a time, then generated concurrently when each writes to its own
+    module directory (client formatting runs in subprocesses, so threads
+    overlap well). A custom output_dir is shared, so it is generated serially,
+    as is everything when --no-parallel is passed.
+    """
+    args = sys.argv[1:]
+    parallel = "--no-parallel" not in args
+    args = [arg for arg in args if arg != "--no-parallel"]
+
+    if not args:
+        print(
+            "Usage: module_codegen.py <module_name>[,<module_name>...] [output_dir]"
+            " [--no-parallel]",
+            file=sys.stderr,
+        )
         sys.exit(1)
 
+    module_names = [name.strip() for name in args[0].split(",") if name.strip()]
+    output_dir = Path(args[1]) if len(args) > 1 else None
+
+    module_apps = {}
+    for module_name in module_names:
+        if len(module_names) > 1:
+            print("")
+            print("=" * 70)
+            print(f"🔨 Loading module: {module_name}")
+            print("=" * 70)
+
+        try:
+            module_apps[module_name] = load_module_app(module_name)
+        except Exception as e:
+            _fail(module_name, e)
+
+    if output_dir:
+        print(f"📁 Using custom output directory: {output_dir}")
+
+    if not parallel or output_dir or len(module_apps) < 2:
+        for module_name, module_app in module_apps.items():
+            try:
+                module_app.gen_specs_and_clients(
+                    clean_first=False, output_dir=output_dir
+                )
+            except Exception as e:
+                _fail(module_name, e)
+            print(f"✅ Successfully generated for {module_name}")
+        return
+
+    with ThreadPoolExecutor(max_workers=len(module_apps)) as executor:
+        futures = {}
+        for module_name, module_app in module_apps.items():
+            future = executor.submit(
+                module_app.gen_specs_and_clients, clean_first=False
+            )
+            futures[future] = module_name
+
+        # Report each module as it finishes, failing on the first error
+        for future in as_completed(futures):
+            module_name = futures[future]
+            error = future.exception()
+            if error is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+                _fail(module_name, error)
+            print(f"✅ Successfully generated for {module_name}")
+
 
 if __name__ == "__main__":
     main()
@@ -5,6 +5,7 @@ Supports selective module enabling via configuration.
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any, AsyncGenerator, Dict
@@ -83,13 +84,38 @@ class ModularApp(FastAPI):
     ) -> None:
         """Generate OpenAPI and AsyncAPI specs and clients for all modules.
 
+        Modules are processed concurrently when each writes to its own module
+        directory: per-module work is dominated by the client formatter
+        subprocesses (autoflake, black, isort), which release the GIL. A shared
+        output_dir is processed serially since every module rewrites the same
+        clients index.
+
         Args:
             clean_first: If True, cleans existing specs/clients before generation
+            output_dir: Optional shared output directory for all modules
         """
-        for module_app in self._modules_apps:
-            module_app.gen_specs_and_clients(
-                clean_first=clean_first, output_dir=output_dir
-            )
+        if output_dir is not None or len(self._modules_apps) < 2:
+            for module_app in self._modules_apps:
+                module_app.gen_specs_and_clients(
+                    clean_first=clean_first, output_dir=output_dir
+                )
+            return
+
+        with ThreadPoolExecutor(max_workers=len(self._modules_apps)) as executor:
+            futures = [
+                executor.submit(module_app.gen_specs_and_clients, clean_first)
+                for module_app in self._modules_apps
+            ]
+            # Re-raise the first failure, as the serial loop would
+            for module_app, future in zip(self._modules_apps, futures):
+                try:
+                    future.result()
+                except Exception:
+                    logger.error(
+                        "❌ Failed to generate specs and clients for "
+                        f"'{module_app.module.name}'"
+                    )
+                    raise
 
     def start(self) -> None:
         """Start the FastAPI application (placeholder for actual server start)."""
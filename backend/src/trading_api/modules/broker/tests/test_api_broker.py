@@ -2,12 +2,17 @@
 Tests for broker API endpoints
 """
 
+import json
 import time
 
 import pytest
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
 from httpx import AsyncClient
 from jose import jwt
 
+from trading_api.app_factory import ModularApp
 from trading_api.shared.config import Settings
 
 
@@ -180,6 +185,51 @@ async def test_get_orders_endpoint(
     assert len(data) >= 1
 
 
+def test_get_orders_uses_json_response(
+    apps: ModularApp, client: TestClient, auth_cookies: dict[str, str]
+) -> None:
+    """Test list endpoints are encoded by Starlette's JSONResponse"""
+    broker_app = next(
+        module_app
+        for module_app in apps.modules_apps
+        if module_app.module.name == "broker"
+    )
+    orders_routes = [
+        route
+        for api_app in broker_app.api_versions
+        for route in api_app.routes
+        if isinstance(route, APIRoute) and route.path == "/orders"
+    ]
+    assert orders_routes
+    for route in orders_routes:
+        # Routes without an explicit class hold FastAPI's DefaultPlaceholder
+        response_class = getattr(route.response_class, "value", route.response_class)
+        assert response_class is JSONResponse
+
+    client.post(
+        "/api/v1/broker/orders",
+        json={
+            "symbol": "AAPL",
+            "type": 1,
+            "side": 1,
+            "qty": 100,
+            "limitPrice": 150.0,
+        },
+        cookies=auth_cookies,
+    )
+    response = client.get("/api/v1/broker/orders", cookies=auth_cookies)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    data = response.json()
+    assert isinstance(data, list)
+    assert len(data) >= 1
+    # Body bytes match Starlette's JSONResponse encoding exactly
+    assert response.content == json.dumps(
+        data, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
 @pytest.mark.asyncio
 async def test_modify_order_endpoint(
     async_client: AsyncClient, auth_cookies: dict[str, str]
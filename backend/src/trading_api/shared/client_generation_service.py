@@ -4,23 +4,77 @@ Service for generating type-safe Python HTTP clients from OpenAPI specifications
 Used during module startup to automatically regenerate clients when specs change.
 """
 
-import json
 import logging
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template
+
+from trading_api.shared.utils import load_json_bytes, write_file_bytes
 
 logger = logging.getLogger(__name__)
 
+# Type hints that never need a model import in generated clients
+_PRIMITIVE_TYPES = frozenset({"str", "int", "float", "bool", "Any", "dict[str, Any]"})
+
+# Path item keys that are operations (others: parameters, summary, servers, ...)
+_HTTP_METHODS = frozenset({"get", "post", "put", "delete", "patch"})
+
+# OpenAPI scalar/object schema types -> Python type hints (arrays and $ref are
+# handled separately; anything else maps to Any)
+_TYPE_MAP = {
+    "string": "str",
+    "integer": "int",
+    "number": "float",
+    "boolean": "bool",
+    "object": "dict[str, Any]",
+}
+
+
+_CLIENTS_INDEX_HEADER = '''"""
+Generated Python HTTP clients for inter-module communication.
+
+These clients enable type-safe HTTP communication when modules run as
+separate processes/services (multi-process architecture).
+
+Auto-generated during module startup when OpenAPI specs change.
+DO NOT EDIT MANUALLY.
+"""
 
+'''
+
+
+@lru_cache(maxsize=None)
+def _get_template_env(templates_dir: Path) -> Environment:
+    """Get the shared Jinja2 environment for a templates directory.
+
+    One environment per process keeps its parsed-template cache warm across
+    modules and versions; the bytecode cache (in the system temp directory)
+    lets later processes skip compiling the templates again. Templates are
+    not edited while generation runs, so auto_reload is off and get_template
+    does not stat the source file on every lookup.
+    """
+    return Environment(
+        loader=FileSystemLoader(templates_dir),
+        trim_blocks=True,
+        lstrip_blocks=True,
+        bytecode_cache=FileSystemBytecodeCache(),
+        auto_reload=False,
+    )
+
+
+@lru_cache(maxsize=None)
 def _extract_schema_name(ref: str) -> str:
     """Extract schema name from $ref string.
 
+    Memoized: the same refs (shared models, enums) recur across operations
+    and modules.
+
     Example: "#/components/schemas/PlacedOrder" -> "PlacedOrder"
     """
-    return ref.split("/")[-1]
+    return ref.rpartition("/")[2]
 
 
 def _is_enum_type(schema: dict[str, Any], components: dict[str, Any]) -> bool:
@@ -41,7 +95,7 @@ def _is_enum_type(schema: dict[str, Any], components: dict[str, Any]) -> bool:
     return "enum" in schema
 
 
-def _get_python_type(schema: dict[str, Any], components: dict[str, Any]) -> str:
+def _get_python_type(schema: dict[str, Any]) -> str:
     """Convert OpenAPI schema to Python type hint.
 
     Handles:
@@ -49,6 +103,9 @@ def _get_python_type(schema: dict[str, Any], components: dict[str, Any]) -> str:
     - array -> list[Type]
     - object -> dict[str, Any]
     - primitives -> str, int, float, bool
+
+    Only the $ref name is needed (never the resolved component), so no
+    components dict is threaded through the recursion.
     """
     if "$ref" in schema:
         model_name = _extract_schema_name(schema["$ref"])
@@ -59,20 +116,9 @@ def _get_python_type(schema: dict[str, Any], components: dict[str, Any]) -> str:
     schema_type = schema.get("type", "any")
 
     if schema_type == "array":
-        items_type = _get_python_type(schema.get("items", {}), components)
+        items_type = _get_python_type(schema.get("items", {}))
         return f"list[{items_type}]"
-    elif schema_type == "object":
-        return "dict[str, Any]"
-    elif schema_type == "string":
-        return "str"
-    elif schema_type == "integer":
-        return "int"
-    elif schema_type == "number":
-        return "float"
-    elif schema_type == "boolean":
-        return "bool"
-    else:
-        return "Any"
+    return _TYPE_MAP.get(schema_type, "Any")
 
 
 def _expand_body_schema(
@@ -100,7 +146,7 @@ def _expand_body_schema(
     body_params = []
 
     for field_name, field_schema in properties.items():
-        field_type = _get_python_type(field_schema, components)
+        field_type = _get_python_type(field_schema)
         is_enum = _is_enum_type(field_schema, components)
         body_params.append(
             {
@@ -116,55 +162,62 @@ def _expand_body_schema(
     return body_params
 
 
-def _extract_operations(spec: dict[str, Any]) -> list[dict[str, Any]]:
+def _extract_operations(
+    spec: dict[str, Any],
+) -> tuple[list[dict[str, Any]], set[str]]:
     """Extract all operations from OpenAPI spec.
 
-    Returns list of operation dicts with:
+    Returns a tuple of (operations, spec_operation_ids). Each operation dict has:
     - operation_id: str
     - method: str (get, post, put, delete, etc.)
     - path: str
     - parameters: list[dict]
     - request_body: dict | None
     - response_type: str (Python type hint)
+
+    spec_operation_ids holds every operation ID found in the spec, collected
+    in the same pass so route verification does not walk the paths again.
     """
     operations = []
+    spec_operation_ids: set[str] = set()
     paths = spec.get("paths", {})
     components = spec.get("components", {})
 
     for path, path_item in paths.items():
         for method, operation in path_item.items():
-            if method not in ["get", "post", "put", "delete", "patch"]:
+            if method not in _HTTP_METHODS:
                 continue
 
             operation_id = operation.get(
                 "operationId", f"{method}_{path.replace('/', '_')}"
             )
+            spec_operation_ids.add(operation_id)
 
-            parameters = []
-            for param in operation.get("parameters", []):
-                param_schema = param.get("schema", {})
-                param_type = _get_python_type(param_schema, components)
-                is_enum = _is_enum_type(param_schema, components)
-                parameters.append(
-                    {
-                        "name": param["name"],
-                        "in": param.get("in", "query"),
-                        "required": param.get("required", False),
-                        "type": param_type,
-                        "description": param.get("description", ""),
-                        "is_enum": is_enum,
-                    }
-                )
+            parameters = [
+                {
+                    "name": param["name"],
+                    "in": param.get("in", "query"),
+                    "required": param.get("required", False),
+                    "type": _get_python_type(param_schema := param.get("schema", {})),
+                    "description": param.get("description", ""),
+                    "is_enum": _is_enum_type(param_schema, components),
+                }
+                for param in operation.get("parameters", [])
+            ]
 
             request_body = None
-            if "requestBody" in operation:
-                content = operation["requestBody"].get("content", {})
-                json_content = content.get("application/json", {})
-                if "schema" in json_content:
-                    schema = json_content["schema"]
-
-                    if "$ref" in schema:
-                        schema_name = _extract_schema_name(schema["$ref"])
+            request_body_spec = operation.get("requestBody")
+            if request_body_spec is not None:
+                body_required = request_body_spec.get("required", True)
+                schema = (
+                    request_body_spec.get("content", {})
+                    .get("application/json", {})
+                    .get("schema")
+                )
+                if schema is not None:
+                    ref = schema.get("$ref")
+                    if ref is not None:
+                        schema_name = _extract_schema_name(ref)
                         if schema_name.startswith("Body_"):
                             body_params = _expand_body_schema(schema_name, components)
                             if body_params:
@@ -177,24 +230,27 @@ def _extract_operations(spec: dict[str, Any]) -> list[dict[str, Any]]:
                         else:
                             request_body = {
                                 "type": schema_name,
-                                "required": operation["requestBody"].get(
-                                    "required", True
-                                ),
+                                "required": body_required,
                             }
                     else:
-                        body_type = _get_python_type(schema, components)
+                        body_type = _get_python_type(schema)
                         request_body = {
                             "type": body_type,
-                            "required": operation["requestBody"].get("required", True),
+                            "required": body_required,
                         }
 
             response_type = "Any"
             responses = operation.get("responses", {})
-            success_response = responses.get("200", responses.get("201", {}))
-            if "content" in success_response:
-                json_content = success_response["content"].get("application/json", {})
-                if "schema" in json_content:
-                    response_type = _get_python_type(json_content["schema"], components)
+            success_response = responses.get("200")
+            if success_response is None:
+                success_response = responses.get("201", {})
+            response_schema = (
+                success_response.get("content", {})
+                .get("application/json", {})
+                .get("schema")
+            )
+            if response_schema is not None:
+                response_type = _get_python_type(response_schema)
 
             operations.append(
                 {
@@ -210,7 +266,19 @@ def _extract_operations(spec: dict[str, Any]) -> list[dict[str, Any]]:
                 }
             )
 
-    return operations
+    return operations, spec_operation_ids
+
+
+def _extract_model(type_name: str) -> str | None:
+    """Get the model name a Python type hint needs imported, if any.
+
+    Unwraps list[...] and returns None for primitives and Body_ schemas.
+    """
+    if "list[" in type_name:
+        type_name = type_name.replace("list[", "").replace("]", "")
+    if type_name in _PRIMITIVE_TYPES or type_name.startswith("Body_"):
+        return None
+    return type_name
 
 
 def _collect_model_imports(operations: list[dict[str, Any]]) -> set[str]:
@@ -218,56 +286,17 @@ def _collect_model_imports(operations: list[dict[str, Any]]) -> set[str]:
     models = set()
 
     for op in operations:
-        response_type = op["response_type"]
-        if "list[" in response_type:
-            model = response_type.replace("list[", "").replace("]", "")
-            if model not in [
-                "str",
-                "int",
-                "float",
-                "bool",
-                "Any",
-                "dict[str, Any]",
-            ] and not model.startswith("Body_"):
+        type_names = [op["response_type"]]
+        request_body = op["request_body"]
+        # Expanded Body_ fields are already listed among the parameters
+        if request_body and request_body["type"] != "expanded":
+            type_names.append(request_body["type"])
+        type_names.extend(param["type"] for param in op["parameters"])
+
+        for type_name in type_names:
+            model = _extract_model(type_name)
+            if model is not None:
                 models.add(model)
-        elif response_type not in [
-            "str",
-            "int",
-            "float",
-            "bool",
-            "Any",
-            "dict[str, Any]",
-        ] and not response_type.startswith("Body_"):
-            models.add(response_type)
-
-        if op["request_body"]:
-            body_type = op["request_body"]["type"]
-            if (
-                body_type != "expanded"
-                and body_type
-                not in [
-                    "str",
-                    "int",
-                    "float",
-                    "bool",
-                    "Any",
-                    "dict[str, Any]",
-                ]
-                and not body_type.startswith("Body_")
-            ):
-                models.add(body_type)
-
-        for param in op["parameters"]:
-            param_type = param["type"]
-            if param_type not in [
-                "str",
-                "int",
-                "float",
-                "bool",
-                "Any",
-                "dict[str, Any]",
-            ] and not param_type.startswith("Body_"):
-                models.add(param_type)
 
     return models
 
@@ -287,11 +316,8 @@ class ClientGenerationService:
 
         self.clients_dir.mkdir(parents=True, exist_ok=True)
 
-        self.template_env = Environment(
-            loader=FileSystemLoader(templates_dir),
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
+        self.template_env = _get_template_env(templates_dir)
+        self._client_template: Template | None = None
 
     def generate_module_client(self, spec_path: Path) -> tuple[bool, list[str]]:
         """Generate Python HTTP client for a single module.
@@ -304,18 +330,19 @@ class ClientGenerationService:
             Tuple of (success, missing_routes)
         """
         module_name_version = spec_path.stem.replace("_openapi", "")
-        module_name = module_name_version.rsplit("_", 1)[0]
-        module_version = module_name_version.rsplit("_", 1)[1]
+        module_name, module_version = module_name_version.rsplit("_", 1)
         try:
-            with open(spec_path) as f:
-                spec: dict[str, Any] = json.load(f)
+            spec: dict[str, Any] = load_json_bytes(spec_path.read_bytes())
 
-            operations = _extract_operations(spec)
+            operations, spec_operation_ids = _extract_operations(spec)
             models = _collect_model_imports(operations)
 
-            template = self.template_env.get_template("python_client.py.j2")
+            if self._client_template is None:
+                self._client_template = self.template_env.get_template(
+                    "python_client.py.j2"
+                )
 
-            client_code = template.render(
+            client_code = self._client_template.render(
                 module_name=module_name,
                 class_name=f"{module_name.capitalize()}Client",
                 operations=operations,
@@ -323,10 +350,10 @@ class ClientGenerationService:
             )
 
             output_file = self.clients_dir / f"{module_name}_{module_version}_client.py"
-            output_file.write_text(client_code)
+            write_file_bytes(output_file, client_code.encode("utf-8"))
 
             success, missing_routes = self._verify_all_routes_generated(
-                spec, operations
+                spec_operation_ids, operations
             )
 
             return success, missing_routes
@@ -348,37 +375,26 @@ class ClientGenerationService:
                 logger.warning("No client files found to export in __init__.py")
                 return
 
-            imports = []
-            exports = []
-
+            clients = []
             for client_file in client_files:
                 # File name is like "broker_v1_client.py"
                 # Extract module name without version: "broker"
                 stem_without_client = client_file.stem.replace("_client", "")
                 module_name = stem_without_client.rsplit("_", 1)[0]  # Remove version
-                class_name = f"{module_name.capitalize()}Client"
-                imports.append(f"from .{client_file.stem} import {class_name}")
-                exports.append(f'    "{class_name}",')
-
-            init_content = f'''"""
-Generated Python HTTP clients for inter-module communication.
+                clients.append((client_file.stem, f"{module_name.capitalize()}Client"))
 
-These clients enable type-safe HTTP communication when modules run as
-separate processes/services (multi-process architecture).
-
-Auto-generated during module startup when OpenAPI specs change.
-DO NOT EDIT MANUALLY.
-"""
-
-{chr(10).join(imports)}
-
-__all__ = [
-{chr(10).join(exports)}
-]
-'''
+            # Built as one list of lines and joined once
+            parts = [_CLIENTS_INDEX_HEADER]
+            parts.extend(
+                f"from .{stem} import {class_name}\n" for stem, class_name in clients
+            )
+            parts.append("\n__all__ = [\n")
+            parts.extend(f'    "{class_name}",\n' for _, class_name in clients)
+            parts.append("]\n")
+            init_content = "".join(parts)
 
             output_file = self.clients_dir / "__init__.py"
-            output_file.write_text(init_content)
+            write_file_bytes(output_file, init_content.encode("utf-8"))
 
             logger.info(f"✅ Updated clients index: {len(client_files)} clients")
 
@@ -440,28 +456,17 @@ __all__ = [
             return True
 
     def _verify_all_routes_generated(
-        self, spec: dict[str, Any], operations: list[dict[str, Any]]
+        self, spec_operation_ids: set[str], operations: list[dict[str, Any]]
     ) -> tuple[bool, list[str]]:
         """Verify that all routes from OpenAPI spec were generated.
 
         Args:
-            spec: OpenAPI specification
+            spec_operation_ids: Operation IDs found in the OpenAPI spec
             operations: Generated operations list
 
         Returns:
             Tuple of (all_routes_present, missing_routes)
         """
-        spec_operation_ids = set()
-
-        for path, path_item in spec.get("paths", {}).items():
-            for method in ["get", "post", "put", "delete", "patch"]:
-                if method in path_item:
-                    operation = path_item[method]
-                    operation_id = operation.get(
-                        "operationId", f"{method}_{path.replace('/', '_')}"
-                    )
-                    spec_operation_ids.add(operation_id)
-
         generated_operation_ids = {op["operation_id"] for op in operations}
 
         missing = sorted(spec_operation_ids - generated_operation_ids)
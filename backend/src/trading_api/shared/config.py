@@ -18,6 +18,9 @@ class Settings(BaseSettings):
     # Cookie Configuration
     COOKIE_SECURE: bool = False  # Set to True in production (HTTPS only)
 
+    # Spec Generation
+    PRETTY_SPECS: bool = False  # Indent generated OpenAPI/AsyncAPI JSON files
+
     model_config = SettingsConfigDict(env_file=".env.local", env_file_encoding="utf-8")
 
     @model_validator(mode="after")
@@ -5,8 +5,8 @@ to integrate with the application factory pattern.
 """
 
 import importlib
-import json
 import logging
+import os
 import shutil
 from abc import ABC, abstractmethod
 from pathlib import Path
@@ -18,8 +18,10 @@ from external_packages.fastws import Client
 from trading_api.models.auth import UserData
 from trading_api.shared.api import APIRouterInterface
 from trading_api.shared.client_generation_service import ClientGenerationService
+from trading_api.shared.config import settings
 from trading_api.shared.middleware.auth import get_current_user_ws
 from trading_api.shared.service_interface import ServiceInterface
+from trading_api.shared.utils import dump_json_bytes, load_json_bytes, write_file_bytes
 from trading_api.shared.ws.fastws_adapter import FastWSAdapter
 from trading_api.shared.ws.ws_route_interface import WsRouterInterface
 
@@ -49,9 +51,13 @@ def _compare_specs(old_spec: dict[str, Any], new_spec: dict[str, Any]) -> list[s
         differences.append(f"Version changed: {old_version} → {new_version}")
 
     # Compare paths (OpenAPI - REST endpoints)
+    # Key sets are built with set(dict) (C-level key iteration) and compared
+    # with set operations; path dicts are looked up once, not per path.
     if "paths" in new_spec or "paths" in old_spec:
-        old_paths = set(old_spec.get("paths", {}).keys())
-        new_paths = set(new_spec.get("paths", {}).keys())
+        old_path_items = old_spec.get("paths", {})
+        new_path_items = new_spec.get("paths", {})
+        old_paths = set(old_path_items)
+        new_paths = set(new_path_items)
 
         added_paths = new_paths - old_paths
         removed_paths = old_paths - new_paths
@@ -62,20 +68,18 @@ def _compare_specs(old_spec: dict[str, Any], new_spec: dict[str, Any]) -> list[s
             differences.append(f"Removed endpoints: {', '.join(sorted(removed_paths))}")
 
         # Compare path operations for common endpoints
-        common_paths = old_paths & new_paths
-        for path in common_paths:
-            old_methods = set(old_spec.get("paths", {}).get(path, {}).keys())
-            new_methods = set(new_spec.get("paths", {}).get(path, {}).keys())
-
-            if old_methods != new_methods:
+        for path in old_paths & new_paths:
+            old_item = old_path_items[path]
+            new_item = new_path_items[path]
+            if old_item.keys() != new_item.keys():
                 differences.append(
-                    f"Methods changed for {path}: {old_methods} → {new_methods}"
+                    f"Methods changed for {path}: {set(old_item)} → {set(new_item)}"
                 )
 
     # Compare channels (AsyncAPI - WebSocket channels)
     if "channels" in new_spec or "channels" in old_spec:
-        old_channels = set(old_spec.get("channels", {}).keys())
-        new_channels = set(new_spec.get("channels", {}).keys())
+        old_channels = set(old_spec.get("channels", {}))
+        new_channels = set(new_spec.get("channels", {}))
 
         added_channels = new_channels - old_channels
         removed_channels = old_channels - new_channels
@@ -91,8 +95,8 @@ def _compare_specs(old_spec: dict[str, Any], new_spec: dict[str, Any]) -> list[s
     old_schemas = old_spec.get("components", {}).get("schemas", {})
     new_schemas = new_spec.get("components", {}).get("schemas", {})
 
-    old_schema_names = set(old_schemas.keys())
-    new_schema_names = set(new_schemas.keys())
+    old_schema_names = set(old_schemas)
+    new_schema_names = set(new_schemas)
 
     added_schemas = new_schema_names - old_schema_names
     removed_schemas = old_schema_names - new_schema_names
@@ -103,17 +107,74 @@ def _compare_specs(old_spec: dict[str, Any], new_spec: dict[str, Any]) -> list[s
         differences.append(f"Removed models: {', '.join(sorted(removed_schemas))}")
 
     # Check for schema changes in common models
-    common_schemas = old_schema_names & new_schema_names
-    for schema_name in common_schemas:
-        old_props = set(old_schemas[schema_name].get("properties", {}).keys())
-        new_props = set(new_schemas[schema_name].get("properties", {}).keys())
+    for schema_name in old_schema_names & new_schema_names:
+        old_props = old_schemas[schema_name].get("properties", {})
+        new_props = new_schemas[schema_name].get("properties", {})
 
-        if old_props != new_props:
+        # dict key views compare as sets without materializing them
+        if old_props.keys() != new_props.keys():
             differences.append(f"Schema '{schema_name}' properties changed")
 
     return differences
 
 
+def _is_pretty_json(data: bytes) -> bool:
+    """Tell whether serialized JSON was written indented (PRETTY_SPECS)."""
+    return data.startswith(b"{\n")
+
+
+def _spec_needs_update(
+    spec_file: Path,
+    spec_bytes: bytes,
+    spec: dict[str, Any],
+    spec_kind: str,
+    name: str,
+    clean_first: bool,
+) -> bool:
+    """Decide whether a generated spec file must be (re)written.
+
+    Byte-identical output is detected without parsing the existing file. A
+    file written with the other PRETTY_SPECS formatting is always rewritten;
+    otherwise the existing spec is parsed and compared with _compare_specs.
+
+    Args:
+        spec_file: Path of the spec file on disk
+        spec_bytes: Serialized new specification
+        spec: The newly generated specification
+        spec_kind: Spec label for logging ("OpenAPI" or "AsyncAPI")
+        name: Module name for logging
+        clean_first: True if existing files were just cleaned
+
+    Returns:
+        True if the spec file should be written
+    """
+    if clean_first or not spec_file.exists():
+        logger.info(f"📝 Creating new {spec_kind} spec for '{name}'")
+        return True
+
+    try:
+        existing_bytes = spec_file.read_bytes()
+        if existing_bytes == spec_bytes:
+            logger.info(f"✅ No changes in {spec_kind} spec for '{name}'")
+            return False
+        if _is_pretty_json(existing_bytes) != _is_pretty_json(spec_bytes):
+            logger.info(f"🔄 {spec_kind} spec formatting changed for '{name}'")
+            return True
+        differences = _compare_specs(load_json_bytes(existing_bytes), spec)
+    except Exception as e:
+        logger.warning(f"⚠️  Could not read existing {spec_kind} spec: {e}")
+        return True
+
+    if differences:
+        logger.info(f"🔄 {spec_kind} spec changes detected for '{name}':")
+        for diff in differences:
+            logger.info(f"   • {diff}")
+        return True
+
+    logger.info(f"✅ No changes in {spec_kind} spec for '{name}'")
+    return False
+
+
 class Module(ABC):
     """
     Abstract base class defining the interface for pluggable modules.
@@ -157,11 +218,13 @@ class Module(ABC):
         # Check ws/ directory
         ws_dir = self.module_dir / "ws"
         if ws_dir.exists():
-            ws_versions = {
-                d.stem
-                for d in ws_dir.iterdir()
-                if d.is_dir() and d.stem.startswith("v")
-            }
+            # DirEntry.is_dir() reuses the type from readdir, no extra stat
+            with os.scandir(ws_dir) as entries:
+                ws_versions = {
+                    os.path.splitext(entry.name)[0]
+                    for entry in entries
+                    if entry.is_dir() and entry.name.startswith("v")
+                }
             # Union: a version is valid if it exists in either api/ or ws/
             versions |= ws_versions
 
@@ -386,30 +449,19 @@ class Module(ABC):
         openapi_file = specs_dir / f"{self.name}_openapi.json"
 
         # Compare with existing spec (same logic as lifespan)
-        should_update_openapi: bool = True
-        if openapi_file.exists() and not clean_first:
-            try:
-                with open(openapi_file, "r") as f:
-                    existing_openapi = json.load(f)
-                    differences = _compare_specs(existing_openapi, openapi_schema)
-                    if len(differences) > 0:
-                        logger.info(
-                            f"🔄 OpenAPI spec changes detected for '{self.name}':"
-                        )
-                        for diff in differences:
-                            logger.info(f"   • {diff}")
-                    else:
-                        should_update_openapi = False
-                        logger.info(f"✅ No changes in OpenAPI spec for '{self.name}'")
-            except Exception as e:
-                logger.warning(f"⚠️  Could not read existing OpenAPI spec: {e}")
-        else:
-            logger.info(f"📝 Creating new OpenAPI spec for '{self.name}'")
+        openapi_bytes = dump_json_bytes(openapi_schema, pretty=settings.PRETTY_SPECS)
+        should_update_openapi = _spec_needs_update(
+            openapi_file,
+            openapi_bytes,
+            openapi_schema,
+            "OpenAPI",
+            self.name,
+            clean_first,
+        )
 
         # Write spec only if needed
         if should_update_openapi:
-            with open(openapi_file, "w") as f:
-                json.dump(openapi_schema, f, indent=2)
+            write_file_bytes(openapi_file, openapi_bytes)
             logger.info(f"✅ Updated OpenAPI spec: {openapi_file}")
 
             # Generate Python HTTP client from updated spec (same logic as lifespan)
@@ -451,37 +503,22 @@ class Module(ABC):
             asyncapi_file = specs_dir / f"{self.name}_asyncapi.json"
 
             try:
-                # Compare specs if existing spec was loaded
-                should_update_asyncapi: bool = True
-                if asyncapi_file.exists() and not clean_first:
-                    try:
-                        with open(asyncapi_file, "r") as f:
-                            existing_asyncapi = json.load(f)
-                            differences = _compare_specs(
-                                existing_asyncapi, asyncapi_schema
-                            )
-                            if len(differences) > 0:
-                                logger.info(
-                                    f"🔄 AsyncAPI spec changes detected for '{self.name}':"
-                                )
-                                for diff in differences:
-                                    logger.info(f"   • {diff}")
-                            else:
-                                should_update_asyncapi = False
-                                logger.info(
-                                    f"✅ No changes in AsyncAPI spec for '{self.name}'"
-                                )
-                    except Exception as e:
-                        logger.warning(
-                            f"⚠️  Could not read existing AsyncAPI spec: {e}"
-                        )
-                else:
-                    logger.info(f"📝 Creating new AsyncAPI spec for '{self.name}'")
+                # Compare with existing spec
+                asyncapi_bytes = dump_json_bytes(
+                    asyncapi_schema, pretty=settings.PRETTY_SPECS
+                )
+                should_update_asyncapi = _spec_needs_update(
+                    asyncapi_file,
+                    asyncapi_bytes,
+                    asyncapi_schema,
+                    "AsyncAPI",
+                    self.name,
+                    clean_first,
+                )
 
                 # Write spec only if needed
                 if should_update_asyncapi:
-                    with open(asyncapi_file, "w") as f:
-                        json.dump(asyncapi_schema, f, indent=2)
+                    write_file_bytes(asyncapi_file, asyncapi_bytes)
                     logger.info(f"✅ Updated AsyncAPI spec: {asyncapi_file}")
 
             except Exception as e:
@@ -602,39 +639,30 @@ class ModuleApp:
                 shutil.rmtree(clients_dir)
                 logger.info(f"🧹 Cleaned clients for '{moduleName}'")
 
+        # Created once for all versions rather than on every iteration
+        specs_dir.mkdir(parents=True, exist_ok=True)
+
         # Generate OpenAPI spec from the provided app
         for version, (api_app, ws_app) in self.versions.items():
             openapi_schema = api_app.openapi()
-            specs_dir.mkdir(parents=True, exist_ok=True)
             openapi_file = specs_dir / f"{moduleName}_{version}_openapi.json"
 
             # Compare with existing spec (same logic as lifespan)
-            should_update_openapi: bool = True
-            if openapi_file.exists() and not clean_first:
-                try:
-                    with open(openapi_file, "r") as f:
-                        existing_openapi = json.load(f)
-                        differences = _compare_specs(existing_openapi, openapi_schema)
-                        if len(differences) > 0:
-                            logger.info(
-                                f"🔄 OpenAPI spec changes detected for '{moduleName}':"
-                            )
-                            for diff in differences:
-                                logger.info(f"   • {diff}")
-                        else:
-                            should_update_openapi = False
-                            logger.info(
-                                f"✅ No changes in OpenAPI spec for '{moduleName}'"
-                            )
-                except Exception as e:
-                    logger.warning(f"⚠️  Could not read existing OpenAPI spec: {e}")
-            else:
-                logger.info(f"📝 Creating new OpenAPI spec for '{moduleName}'")
+            openapi_bytes = dump_json_bytes(
+                openapi_schema, pretty=settings.PRETTY_SPECS
+            )
+            should_update_openapi = _spec_needs_update(
+                openapi_file,
+                openapi_bytes,
+                openapi_schema,
+                "OpenAPI",
+                moduleName,
+                clean_first,
+            )
 
             # Write spec only if needed
             if should_update_openapi:
-                with open(openapi_file, "w") as f:
-                    json.dump(openapi_schema, f, indent=2)
+                write_file_bytes(openapi_file, openapi_bytes)
                 logger.info(f"✅ Updated OpenAPI spec: {openapi_file}")
 
                 # Generate Python HTTP client from updated spec (same logic as lifespan)
@@ -675,37 +703,22 @@ class ModuleApp:
                 asyncapi_file = specs_dir / f"{moduleName}_{version}_asyncapi.json"
 
                 try:
-                    # Compare specs if existing spec was loaded
-                    should_update_asyncapi: bool = True
-                    if asyncapi_file.exists() and not clean_first:
-                        try:
-                            with open(asyncapi_file, "r") as f:
-                                existing_asyncapi = json.load(f)
-                                differences = _compare_specs(
-                                    existing_asyncapi, asyncapi_schema
-                                )
-                                if len(differences) > 0:
-                                    logger.info(
-                                        f"🔄 AsyncAPI spec changes detected for '{moduleName}':"
-                                    )
-                                    for diff in differences:
-                                        logger.info(f"   • {diff}")
-                                else:
-                                    should_update_asyncapi = False
-                                    logger.info(
-                                        f"✅ No changes in AsyncAPI spec for '{moduleName}'"
-                                    )
-                        except Exception as e:
-                            logger.warning(
-                                f"⚠️  Could not read existing AsyncAPI spec: {e}"
-                            )
-                    else:
-                        logger.info(f"📝 Creating new AsyncAPI spec for '{moduleName}'")
+                    # Compare with existing spec
+                    asyncapi_bytes = dump_json_bytes(
+                        asyncapi_schema, pretty=settings.PRETTY_SPECS
+                    )
+                    should_update_asyncapi = _spec_needs_update(
+                        asyncapi_file,
+                        asyncapi_bytes,
+                        asyncapi_schema,
+                        "AsyncAPI",
+                        moduleName,
+                        clean_first,
+                    )
 
                     # Write spec only if needed
                     if should_update_asyncapi:
-                        with open(asyncapi_file, "w") as f:
-                            json.dump(asyncapi_schema, f, indent=2)
+                        write_file_bytes(asyncapi_file, asyncapi_bytes)
                         logger.info(f"✅ Updated AsyncAPI spec: {asyncapi_file}")
 
                 except Exception as e:
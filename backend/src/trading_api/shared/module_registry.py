@@ -5,6 +5,7 @@ Provides registration, discovery, and filtering of pluggable modules.
 
 import importlib
 import logging
+import os
 from pathlib import Path
 from typing import Dict
 
@@ -63,12 +64,16 @@ class ModuleRegistry:
         discovered_modules = {}
 
         # Step 1: Discover all modules
-        for module_path in self._modules_dir.iterdir():
-            # Skip non-directories and private/internal modules
-            if not module_path.is_dir() or module_path.name.startswith("_"):
-                continue
-
-            module_name = module_path.name
+        # (DirEntry.is_dir() reuses the type from readdir, no extra stat)
+        with os.scandir(self._modules_dir) as entries:
+            module_names = [
+                entry.name
+                for entry in entries
+                # Skip non-directories and private/internal modules
+                if entry.is_dir() and not entry.name.startswith("_")
+            ]
+
+        for module_name in module_names:
             class_name = f"{module_name.title()}Module"
 
             try:
@@ -3,12 +3,155 @@
 Provides helper functions for module discovery, configuration, and common utilities.
 """
 
+import json
+import os
 from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:  # orjson is an optional speedup
+    _HAS_ORJSON = False
+
+
+def dump_json_bytes(obj: Any, pretty: bool = True) -> bytes:
+    """Serialize an object to UTF-8 JSON.
+
+    Uses orjson when it is installed, falling back to the stdlib json module.
+
+    Args:
+        obj: JSON-serializable object (e.g. an OpenAPI/AsyncAPI schema)
+        pretty: If True, indent with 2 spaces; otherwise emit compact JSON
+
+    Returns:
+        Encoded JSON document
+    """
+    if _HAS_ORJSON:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def load_json_bytes(data: bytes) -> Any:
+    """Parse a UTF-8 JSON document.
+
+    Uses orjson when it is installed, falling back to the stdlib json module.
+
+    Args:
+        data: Encoded JSON document (e.g. the raw content of a spec file)
+
+    Returns:
+        Decoded JSON value
+    """
+    if _HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def write_file_bytes(path: Path, data: bytes) -> None:
+    """Write bytes to a file through a raw file descriptor.
+
+    Bypasses the buffered I/O layer: the payload is handed to os.write()
+    directly (looping only on partial writes), so a typical file is written
+    with a single syscall and no intermediate copies.
+
+    Args:
+        path: Destination file (created or truncated)
+        data: Content to write
+
+    Raises:
+        OSError: If the file cannot be opened or written
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+
+# Discovery results keyed by (modules_dir, websockets_only), tagged with the
+# st_mtime_ns of modules_dir and of every candidate module directory they were
+# computed at. Adding, removing or renaming a module directory bumps the
+# former; adding or removing __init__.py, ws.py or ws/ inside a module bumps
+# that module's own mtime. Either invalidates the entry.
+_discovery_cache: dict[
+    tuple[Path, bool], tuple[int, tuple[tuple[str, int], ...], list[str]]
+] = {}
+
+
+def _resolve_modules_dir(base_dir: Path | str | None) -> Path:
+    if base_dir is None:
+        # Default to trading_api/modules
+        return Path(__file__).parent.parent / "modules"
+    return Path(base_dir)
+
+
+def _dir_mtimes_match(base_dir: Path, dir_mtimes: tuple[tuple[str, int], ...]) -> bool:
+    """Check that each module directory still has its recorded mtime."""
+    for name, mtime_ns in dir_mtimes:
+        try:
+            if os.stat(os.path.join(base_dir, name)).st_mtime_ns != mtime_ns:
+                return False
+        except OSError:
+            return False
+    return True
+
+
+def _scan_modules(base_dir: Path, websockets_only: bool) -> list[str]:
+    """Scan modules_dir once, caching the result until a directory changes."""
+    try:
+        mtime_ns = os.stat(base_dir).st_mtime_ns
+    except OSError:
+        return []
+
+    cache_key = (base_dir, websockets_only)
+    cached = _discovery_cache.get(cache_key)
+    if (
+        cached is not None
+        and cached[0] == mtime_ns
+        and _dir_mtimes_match(base_dir, cached[1])
+    ):
+        return list(cached[2])
+
+    # Find all directories that are not __pycache__ and have __init__.py
+    # (DirEntry.is_dir() reuses the type from readdir, no extra stat)
+    modules = []
+    dir_mtimes = []
+    with os.scandir(base_dir) as entries:
+        for entry in entries:
+            if entry.name.startswith("_") or not entry.is_dir():
+                continue
+            dir_mtimes.append((entry.name, entry.stat().st_mtime_ns))
+            if not os.path.exists(os.path.join(entry.path, "__init__.py")):
+                continue
+            # Check for ws.py or ws/ directory
+            if websockets_only and not (
+                os.path.exists(os.path.join(entry.path, "ws.py"))
+                or os.path.isdir(os.path.join(entry.path, "ws"))
+            ):
+                continue
+            modules.append(entry.name)
+
+    modules.sort()
+    _discovery_cache[cache_key] = (mtime_ns, tuple(dir_mtimes), modules)
+    return list(modules)
 
 
 def discover_modules(base_dir: Path | str | None = None) -> list[str]:
     """Discover all available modules in the modules directory.
 
+    Results are cached per process and reused until the modules directory
+    or one of the module directories changes.
+
     Args:
         base_dir: Base directory containing modules/ folder. If None, uses
                  the trading_api root directory.
@@ -20,31 +163,15 @@ def discover_modules(base_dir: Path | str | None = None) -> list[str]:
         >>> discover_modules()
         ['broker', 'datafeed']
     """
-    if base_dir is None:
-        # Default to trading_api/modules
-        base_dir = Path(__file__).parent.parent / "modules"
-    else:
-        base_dir = Path(base_dir)
-
-    if not base_dir.exists():
-        return []
-
-    # Find all directories that are not __pycache__ and have __init__.py
-    modules = []
-    for item in base_dir.iterdir():
-        if (
-            item.is_dir()
-            and not item.name.startswith("_")
-            and (item / "__init__.py").exists()
-        ):
-            modules.append(item.name)
-
-    return sorted(modules)
+    return _scan_modules(_resolve_modules_dir(base_dir), websockets_only=False)
 
 
 def discover_modules_with_websockets(base_dir: Path | str | None = None) -> list[str]:
     """Discover modules that have WebSocket routers.
 
+    Results are cached per process and reused until the modules directory
+    or one of the module directories changes.
+
     Args:
         base_dir: Base directory containing modules/ folder. If None, uses
                  the trading_api root directory.
@@ -56,19 +183,4 @@ def discover_modules_with_websockets(base_dir: Path | str | None = None) -> list
         >>> discover_modules_with_websockets()
         ['broker', 'datafeed']
     """
-    all_modules = discover_modules(base_dir)
-
-    if base_dir is None:
-        base_dir = Path(__file__).parent.parent / "modules"
-    else:
-        base_dir = Path(base_dir)
-
-    # Filter modules that have WebSocket support
-    ws_modules = []
-    for module_name in all_modules:
-        module_dir = base_dir / module_name
-        # Check for ws.py or ws/ directory
-        if (module_dir / "ws.py").exists() or (module_dir / "ws").is_dir():
-            ws_modules.append(module_name)
-
-    return ws_modules
+    return _scan_modules(_resolve_modules_dir(base_dir), websockets_only=True)
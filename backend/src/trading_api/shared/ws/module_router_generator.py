@@ -24,15 +24,31 @@ Usage:
     >>> # If route is empty or invalid -> ValueError
 """
 
+import ast
+import hashlib
 import logging
 import re
 import shutil
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 from typing import NamedTuple
 
+from trading_api.shared.utils import write_file_bytes
+
 logger = logging.getLogger(__name__)
 
+# Matches both single-line and multi-line TypeAlias declarations (\s also
+# spans newlines, so no DOTALL is needed). Examples:
+#   BarWsRouter: TypeAlias = WsRouter[BarsSubscriptionRequest, Bar]
+#   BrokerConnectionWsRouter: TypeAlias = WsRouter[
+#       BrokerConnectionSubscriptionRequest, BrokerConnectionStatus
+#   ]
+_TYPEALIAS_RE = re.compile(
+    r"^\s*(\w+):\s*TypeAlias\s*=\s*WsRouter\[\s*(\w+)\s*,\s*(\w+)\s*\]",
+    re.MULTILINE,
+)
+
 
 class RouterSpec(NamedTuple):
     """Specification for generating a router."""
@@ -63,21 +79,15 @@ def parse_router_specs_from_file(file_path: Path, module_name: str) -> list[Rout
         >>> print(specs[0].class_name)  # "BarWsRouter"
     """
     router_specs = []
-    # Pattern matches both single-line and multi-line TypeAlias declarations
-    # Examples:
-    #   BarWsRouter: TypeAlias = WsRouter[BarsSubscriptionRequest, Bar]
-    #   BrokerConnectionWsRouter: TypeAlias = WsRouter[
-    #       BrokerConnectionSubscriptionRequest, BrokerConnectionStatus
-    #   ]
-    pattern = re.compile(
-        r"^\s*(\w+):\s*TypeAlias\s*=\s*WsRouter\[\s*(\w+)\s*,\s*(\w+)\s*\]",
-        re.MULTILINE | re.DOTALL,
-    )
-
     content = file_path.read_text()
 
+    # Cheap substring prefilter: skip the regex scan for files that cannot
+    # declare any WsRouter TypeAlias
+    if "WsRouter[" not in content:
+        return router_specs
+
     # Find all matches in the file
-    for match in pattern.finditer(content):
+    for match in _TYPEALIAS_RE.finditer(content):
         class_name = match.group(1)
         request_type = match.group(2)
         data_type = match.group(3)
@@ -94,29 +104,42 @@ def parse_router_specs_from_file(file_path: Path, module_name: str) -> list[Rout
     return router_specs
 
 
-def generate_router_code(spec: RouterSpec, template: str) -> str:
+_INIT_FILE_HEADER = '''"""
+Auto-generated WebSocket routers.
+
+DO NOT EDIT MANUALLY - Generated by module_router_generator.py
+"""
+
+'''
+
+# Records the digest of the inputs ws_generated/ was last produced from
+_INPUTS_DIGEST_FILE = ".inputs-digest"
+
+# Formatter/linter configuration and pinned versions (relative to backend/),
+# part of the inputs whenever quality checks run
+_QUALITY_CHECK_CONFIG_FILES = ("pyproject.toml", "poetry.lock", ".flake8", "mypy.ini")
+
+# Placeholder for the concrete class name in a prepared router template
+_CLASS_NAME_PLACEHOLDER = "__WS_ROUTER_CLASS_NAME__"
+
+
+@lru_cache(maxsize=None)
+def _prepare_router_template(template: str) -> str:
     """
-    Generate concrete router code from template and spec.
+    Strip the generic scaffolding from the router template once.
+
+    Removes TypeVar declarations and the Generic/TypeVar/BaseModel imports and
+    swaps the WsRouter class declaration for a class-name placeholder, so each
+    router only needs a few str.replace calls. Cached per template content.
 
     Args:
-        spec: Router specification
         template: Template code from generic_route.py
 
     Returns:
-        Generated router code as string
-
-    The function:
-    1. Replaces _TRequest with spec.request_type
-    2. Replaces _TData with spec.data_type
-    3. Removes TypeVar declarations
-    4. Removes Generic and TypeVar imports
-    5. Updates class declaration
+        Prepared template still containing _TRequest/_TData type parameters
     """
-    lines = template.split("\n")
-    result_lines = [
-        f"from trading_api.models import {spec.request_type}, {spec.data_type}"
-    ]
-    for line in lines:
+    result_lines = []
+    for line in template.split("\n"):
         # Skip TypeVar declarations
         if "TypeVar(" in line:
             continue
@@ -131,48 +154,59 @@ def generate_router_code(spec: RouterSpec, template: str) -> str:
             continue
         # Replace class declaration
         if "class WsRouter(" in line:
-            result_lines.append(f"class {spec.class_name}(WsRouteInterface):")
+            result_lines.append(f"class {_CLASS_NAME_PLACEHOLDER}(WsRouteInterface):")
             continue
-        # Replace type parameters
-        modified_line = line.replace("_TRequest", spec.request_type)
-        modified_line = modified_line.replace("_TData", spec.data_type)
-        result_lines.append(modified_line)
+        result_lines.append(line)
     return "\n".join(result_lines)
 
 
-def generate_init_file(specs: list[RouterSpec]) -> str:
+def generate_router_code(spec: RouterSpec, template: str) -> str:
     """
-    Generate __init__.py for the ws_generated package.
+    Generate concrete router code from template and spec.
 
     Args:
-        specs: List of router specifications
+        spec: Router specification
+        template: Template code from generic_route.py
 
     Returns:
-        __init__.py content as string
-    """
-    imports = []
-    exports = []
-
-    for spec in specs:
-        module_name = spec.class_name.lower()
-        imports.append(f"from .{module_name} import {spec.class_name}")
-        exports.append(f'"{spec.class_name}"')
+        Generated router code as string
 
-    imports_str = "\n".join(imports)
-    exports_str = ",\n    ".join(exports)
+    The function:
+    1. Replaces _TRequest with spec.request_type
+    2. Replaces _TData with spec.data_type
+    3. Removes TypeVar declarations
+    4. Removes Generic and TypeVar imports
+    5. Updates class declaration
+    """
+    code = (
+        _prepare_router_template(template)
+        .replace("_TRequest", spec.request_type)
+        .replace("_TData", spec.data_type)
+        .replace(_CLASS_NAME_PLACEHOLDER, spec.class_name)
+    )
+    return (
+        f"from trading_api.models import {spec.request_type}, {spec.data_type}\n" + code
+    )
 
-    return f'''"""
-Auto-generated WebSocket routers.
 
-DO NOT EDIT MANUALLY - Generated by module_router_generator.py
-"""
+def generate_init_file(specs: list[RouterSpec]) -> str:
+    """
+    Generate __init__.py for the ws_generated package.
 
-{imports_str}
+    Args:
+        specs: List of router specifications
 
-__all__ = [
-    {exports_str},
-]
-'''
+    Returns:
+        __init__.py content as string
+    """
+    parts = [_INIT_FILE_HEADER]
+    parts.extend(
+        f"from .{spec.class_name.lower()} import {spec.class_name}\n" for spec in specs
+    )
+    parts.append("\n__all__ = [\n")
+    parts.extend(f'    "{spec.class_name}",\n' for spec in specs)
+    parts.append("]\n")
+    return "".join(parts)
 
 
 def run_quality_checks_for_module(
@@ -283,6 +317,112 @@ def verify_router_imports(
         return False, f"Verification failed: {e}"
 
 
+def _imported_source_files(sources: list[bytes], src_dir: Path) -> list[Path]:
+    """
+    Resolve the trading_api modules imported by some sources to their files.
+
+    A module resolves to its .py file; a package (e.g. trading_api.models)
+    resolves to every .py file beneath it, since its re-exports can come from
+    any submodule.
+
+    Args:
+        sources: Python sources to scan for absolute trading_api imports
+        src_dir: The backend/src directory
+
+    Returns:
+        Sorted, de-duplicated list of imported source files
+    """
+    module_names = set()
+    for source in sources:
+        for node in ast.walk(ast.parse(source)):
+            if isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+                module_names.add(node.module)
+            elif isinstance(node, ast.Import):
+                module_names.update(alias.name for alias in node.names)
+
+    files: set[Path] = set()
+    for module_name in module_names:
+        if module_name.split(".", 1)[0] != "trading_api":
+            continue
+        module_path = src_dir.joinpath(*module_name.split("."))
+        if module_path.is_dir():
+            files.update(module_path.rglob("*.py"))
+        elif module_path.with_suffix(".py").is_file():
+            files.add(module_path.with_suffix(".py"))
+    return sorted(files)
+
+
+def _generation_inputs_digest(
+    router_path: Path,
+    template_bytes: bytes,
+    skip_quality_checks: bool,
+    base_dir: Path,
+) -> str:
+    """
+    Hash everything that determines the generated routers.
+
+    Covers the ws file (router specs), the generic router template, this
+    generator's own source and whether quality checks (formatting) ran. The
+    trading_api modules imported by the ws file and the template (the models
+    the routers are typed with) are tracked by mtime and size. When quality
+    checks run, the tool configuration and lock file are covered too, so a
+    formatter bump or config change reruns them.
+
+    Args:
+        router_path: Path to the ws file declaring the routers
+        template_bytes: Content of generic_route.py
+        skip_quality_checks: Whether formatters/linters are skipped
+        base_dir: The backend directory
+
+    Returns:
+        Hex digest of the generation inputs
+    """
+    router_bytes = router_path.read_bytes()
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(router_bytes)
+    digest.update(template_bytes)
+    digest.update(Path(__file__).read_bytes())
+    digest.update(b"skip-checks" if skip_quality_checks else b"checks")
+
+    src_dir = base_dir / "src"
+    for path in _imported_source_files([router_bytes, template_bytes], src_dir):
+        st = path.stat()
+        relative = path.relative_to(src_dir).as_posix()
+        digest.update(f"{relative}:{st.st_mtime_ns}:{st.st_size}\n".encode())
+
+    if not skip_quality_checks:
+        for name in _QUALITY_CHECK_CONFIG_FILES:
+            try:
+                digest.update((base_dir / name).read_bytes())
+            except FileNotFoundError:
+                digest.update(f"{name}:missing".encode())
+    return digest.hexdigest()
+
+
+def _routers_up_to_date(
+    output_dir: Path, specs: list[RouterSpec], inputs_digest: str
+) -> bool:
+    """
+    Check whether ws_generated/ was produced from the same inputs.
+
+    Args:
+        output_dir: The ws_generated directory
+        specs: Router specifications parsed from the ws file
+        inputs_digest: Digest from _generation_inputs_digest()
+
+    Returns:
+        True if the recorded digest matches and every generated file exists
+    """
+    try:
+        recorded = (output_dir / _INPUTS_DIGEST_FILE).read_bytes()
+    except OSError:
+        return False
+    if recorded.decode("ascii", "replace") != inputs_digest:
+        return False
+    expected = ["__init__.py"] + [f"{spec.class_name.lower()}.py" for spec in specs]
+    return all((output_dir / name).is_file() for name in expected)
+
+
 def generate_ws_routers(
     ws_file: str,
     *,
@@ -380,53 +520,62 @@ def generate_ws_routers(
 
     # Load template
     template_path = base_dir / "src/trading_api/shared/ws/generic_route.py"
-    template = template_path.read_text()
+    template_bytes = template_path.read_bytes()
+    template = template_bytes.decode("utf-8")
 
     # Output directory - place in same directory level as ws router file
     # e.g., modules/broker/ws/v1/ws_generated/
     output_dir = router_path.parent / "ws_generated"
 
-    # Completely remove and recreate to ensure clean state
-    # This removes all generated files, __pycache__, and any leftover artifacts
-    if output_dir.exists():
-        shutil.rmtree(output_dir, ignore_errors=True)
-
-    # Ensure parent ws version directory's __pycache__ is also cleared to avoid import issues
-    ws_version_dir = router_path.parent
-    pycache_dir = ws_version_dir / "__pycache__"
-    if pycache_dir.exists():
-        # Remove any cached imports of ws_generated
-        for cache_file in pycache_dir.glob("*ws_generated*"):
-            cache_file.unlink(missing_ok=True)
+    # Skip regeneration (and the quality-check subprocesses) when the ws file,
+    # template, imported models, generator, tool configs and check mode are
+    # unchanged since the last run
+    inputs_digest = _generation_inputs_digest(
+        router_path, template_bytes, skip_quality_checks, base_dir
+    )
+    up_to_date = _routers_up_to_date(output_dir, router_specs, inputs_digest)
+    if up_to_date:
+        if not silent:
+            print(
+                f"📁 Routers for module '{module_name}' version '{version}' "
+                "are up to date"
+            )
+    else:
+        # Completely remove and recreate to ensure clean state
+        # This removes all generated files, __pycache__, and any leftover artifacts
+        if output_dir.exists():
+            shutil.rmtree(output_dir, ignore_errors=True)
 
-    # Create fresh directory
-    output_dir.mkdir(parents=True, exist_ok=True)
+        # Create fresh directory
+        output_dir.mkdir(parents=True, exist_ok=True)
 
-    if not silent:
-        print(f"📁 Generating routers for module '{module_name}' version '{version}'")
-
-    # Generate each router
-    for spec in router_specs:
-        module_file_name = spec.class_name.lower()
-        output_file = output_dir / f"{module_file_name}.py"
-        content = generate_router_code(spec, template)
-        output_file.write_text(content)
         if not silent:
-            print(f"  ✓ {spec.class_name}")
-
-    # Generate __init__.py
-    init_file = output_dir / "__init__.py"
-    init_content = generate_init_file(router_specs)
-    init_file.write_text(init_content)
+            print(
+                f"📁 Generating routers for module '{module_name}' version '{version}'"
+            )
 
-    # Quality checks
-    if not skip_quality_checks:
-        try:
-            run_quality_checks_for_module(module_name, output_dir)
-        except RuntimeError:
-            # Clean up on failure
-            shutil.rmtree(output_dir)
-            raise
+        # Generate each router
+        for spec in router_specs:
+            module_file_name = spec.class_name.lower()
+            output_file = output_dir / f"{module_file_name}.py"
+            content = generate_router_code(spec, template)
+            write_file_bytes(output_file, content.encode("utf-8"))
+            if not silent:
+                print(f"  ✓ {spec.class_name}")
+
+        # Generate __init__.py
+        init_file = output_dir / "__init__.py"
+        init_content = generate_init_file(router_specs)
+        write_file_bytes(init_file, init_content.encode("utf-8"))
+
+        # Quality checks
+        if not skip_quality_checks:
+            try:
+                run_quality_checks_for_module(module_name, output_dir)
+            except RuntimeError:
+                # Clean up on failure
+                shutil.rmtree(output_dir)
+                raise
 
     # Lightweight verification: check that routers can be imported
     # (does NOT instantiate modules/services to avoid circular dependencies)
@@ -449,6 +598,11 @@ def generate_ws_routers(
         if not silent:
             print(f"    {message}")
 
+    if not up_to_date:
+        write_file_bytes(
+            output_dir / _INPUTS_DIGEST_FILE, inputs_digest.encode("ascii")
+        )
+
     if not silent:
         logger.info(f"✓ Generated WS routers for '{module_name}' version '{version}'")
 
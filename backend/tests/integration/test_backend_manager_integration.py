@@ -210,7 +210,8 @@ async def session_backend_manager(
     with open(nginx_config_path, "w") as f:
         generate_nginx_config(session_test_config, f, pid_file=nginx_pid_file)
 
-    # Create manager with new API (nginx_config_path is auto-generated in __init__)
+    # Create manager (__init__ only sets paths; the config is written above, since
+    # prepare_nginx_config() is called by cmd_start, not by start_all())
     manager = ServerManager(session_test_config)
 
     # Override directories and config path to use tmp_path (shared by all tests)
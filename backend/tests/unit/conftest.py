@@ -0,0 +1,50 @@
+"""Shared fixtures for unit tests.
+
+Fixtures used by more than one unit test module live here:
+
+- fake_module_apps - ModuleApp stand-ins for spec and client generation
+- bump_mtime - Make a file or directory change visible to mtime-based caches
+"""
+
+import os
+import threading
+from collections.abc import Callable
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+
+class FakeModuleApp:
+    """Stand-in for ModuleApp that records spec and client generation calls."""
+
+    def __init__(self, name: str) -> None:
+        self.module = SimpleNamespace(name=name)
+        self.error: Exception | None = None
+        self.calls: list[tuple[bool, Path | None]] = []
+        self.thread_ids: list[int] = []
+
+    def gen_specs_and_clients(
+        self, clean_first: bool = False, output_dir: Path | None = None
+    ) -> None:
+        self.calls.append((clean_first, output_dir))
+        self.thread_ids.append(threading.get_ident())
+        if self.error is not None:
+            raise self.error
+
+
+@pytest.fixture
+def fake_module_apps() -> dict[str, FakeModuleApp]:
+    """Fake broker and datafeed module apps; set .error to make one fail."""
+    return {name: FakeModuleApp(name) for name in ("broker", "datafeed")}
+
+
+@pytest.fixture
+def bump_mtime() -> Callable[[Path], None]:
+    """Move a path's mtime forward, independent of the clock granularity."""
+
+    def bump(path: Path) -> None:
+        mtime_ns = os.stat(path).st_mtime_ns + 1_000_000_000
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+    return bump
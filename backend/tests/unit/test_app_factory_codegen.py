@@ -0,0 +1,65 @@
+"""Unit tests for ModularApp module spec and client generation fan-out.
+
+Test Coverage:
+- ModularApp.gen_module_specs_and_clients() - Parallel and serial paths
+- Failure propagation naming the failing module
+"""
+
+import threading
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from trading_api.app_factory import ModularApp
+
+
+@pytest.fixture
+def modular_app(fake_module_apps: dict[str, Any]) -> ModularApp:
+    """ModularApp generating the fake broker and datafeed module apps."""
+    app = ModularApp([], base_url="/api")
+    app._modules_apps = list(fake_module_apps.values())
+    return app
+
+
+@pytest.mark.unit
+class TestGenModuleSpecsAndClients:
+    """Unit tests for ModularApp.gen_module_specs_and_clients()."""
+
+    def test_generates_all_modules_in_parallel(
+        self, modular_app: ModularApp, fake_module_apps: dict[str, Any]
+    ) -> None:
+        """Test each module is generated once, off the calling thread."""
+        modular_app.gen_module_specs_and_clients(clean_first=True)
+
+        for module_app in fake_module_apps.values():
+            assert module_app.calls == [(True, None)]
+            assert threading.get_ident() not in module_app.thread_ids
+
+    def test_shared_output_dir_is_serial(
+        self,
+        modular_app: ModularApp,
+        fake_module_apps: dict[str, Any],
+        tmp_path: Path,
+    ) -> None:
+        """Test a shared output_dir is generated on the calling thread."""
+        modular_app.gen_module_specs_and_clients(output_dir=tmp_path)
+
+        for module_app in fake_module_apps.values():
+            assert module_app.calls == [(False, tmp_path)]
+            assert module_app.thread_ids == [threading.get_ident()]
+
+    def test_failure_fails_batch_and_names_module(
+        self,
+        modular_app: ModularApp,
+        fake_module_apps: dict[str, Any],
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Test one module raising in the parallel path fails the whole batch."""
+        fake_module_apps["datafeed"].error = RuntimeError("spec export failed")
+
+        with pytest.raises(RuntimeError, match="spec export failed"):
+            modular_app.gen_module_specs_and_clients()
+
+        assert "Failed to generate specs and clients for 'datafeed'" in caplog.text
+        assert "'broker'" not in caplog.text
@@ -0,0 +1,114 @@
+"""Unit tests for backend_manager.py health polling.
+
+These tests drive wait_for_health() against an in-process httpx transport,
+so no real servers are started.
+
+Test Coverage:
+- wait_for_health() - Poll module health endpoints until a time deadline
+- Jittered exponential backoff between attempts
+"""
+
+import asyncio
+import random
+import time
+from collections.abc import Callable
+
+import httpx
+import pytest
+
+from scripts.backend_manager import wait_for_health
+
+BASE_URL = "http://backend.test"
+
+
+def health_client(
+    healthy_after: int, latency: float = 0.0
+) -> tuple[httpx.AsyncClient, Callable[[], int]]:
+    """Create a client whose health endpoints fail for the first requests.
+
+    Args:
+        healthy_after: Number of requests answered with 503 before 200
+        latency: Seconds each request takes to answer
+
+    Returns:
+        The client and a callable returning the number of requests served
+    """
+    requests = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal requests
+        requests += 1
+        await asyncio.sleep(latency)
+        return httpx.Response(200 if requests > healthy_after else 503)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client, lambda: requests
+
+
+@pytest.mark.unit
+class TestWaitForHealth:
+    """Unit tests for the health polling deadline."""
+
+    async def test_healthy_on_first_attempt(self) -> None:
+        """Test a service that is already up is reported healthy at once."""
+        client, requests = health_client(healthy_after=0)
+        async with client:
+            assert await wait_for_health(BASE_URL, ["broker"], client=client)
+
+        assert requests() == 1
+
+    async def test_attempts_are_not_capped_by_max_attempts(self) -> None:
+        """Test backoff retries keep polling until the time deadline."""
+        client, requests = health_client(healthy_after=5)
+        async with client:
+            assert await wait_for_health(
+                BASE_URL,
+                ["broker"],
+                max_attempts=3,
+                delay=0.5,
+                client=client,
+                initial_delay=0.001,
+            )
+
+        assert requests() == 6
+
+    async def test_gives_up_after_deadline(self) -> None:
+        """Test an unhealthy service fails after max_attempts * delay seconds."""
+        client, requests = health_client(healthy_after=1_000, latency=0.02)
+        async with client:
+            start = time.monotonic()
+            assert not await wait_for_health(
+                BASE_URL,
+                ["broker"],
+                max_attempts=4,
+                delay=0.05,
+                client=client,
+                initial_delay=0.01,
+            )
+            elapsed = time.monotonic() - start
+
+        assert 0.2 <= elapsed < 1.0
+        assert requests() > 1
+
+    async def test_backoff_is_jittered(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test each doubling delay is drawn between half and all of its value."""
+        bounds: list[tuple[float, float]] = []
+
+        def uniform(low: float, high: float) -> float:
+            bounds.append((low, high))
+            return low
+
+        monkeypatch.setattr(random, "uniform", uniform)
+        client, _ = health_client(healthy_after=3)
+        async with client:
+            assert await wait_for_health(
+                BASE_URL,
+                ["broker"],
+                delay=0.004,
+                client=client,
+                initial_delay=0.001,
+            )
+
+        assert bounds == pytest.approx(
+            [(0.0005, 0.001), (0.001, 0.002), (0.002, 0.004)]
+        )
@@ -9,6 +9,9 @@ Test Coverage:
 - generate_rest_location_blocks() - Create REST API routing
 - generate_websocket_location_block() - Create WebSocket routing
 - generate_nginx_config() - Generate complete nginx configuration
+- write_nginx_config() - Write nginx configuration to disk
+- nginx_config_digest() - Fingerprint config for regeneration skipping
+- ServerManager.prepare_nginx_config() - Generate, regenerate or validate config
 """
 
 import os
@@ -18,11 +21,17 @@ from typing import TextIO, cast
 
 import pytest
 
+import scripts.backend_manager as backend_manager
 from scripts.backend_manager import (
+    ServerManager,
     generate_nginx_config,
     generate_rest_location_blocks,
     generate_upstream_blocks,
     generate_websocket_location_block,
+    nginx_config_digest,
+    read_nginx_config_digest,
+    render_nginx_config,
+    write_nginx_config,
 )
 from trading_api.shared.deployment import (
     DeploymentConfig,
@@ -247,3 +256,163 @@ class TestNginxConfigGeneration:
 
             finally:
                 os.unlink(f.name)
+
+    def test_write_nginx_config_matches_rendered_config(self) -> None:
+        """Test raw-fd nginx config write produces the rendered config."""
+        config = DeploymentConfig(
+            nginx=NginxConfig(port=8000, worker_processes=1, worker_connections=1024),
+            servers={
+                "broker": ServerConfig(
+                    port=8001, instances=2, modules=["broker"], reload=True
+                ),
+            },
+            websocket=WebSocketConfig(routing_strategy="path", query_param_name="type"),
+            websocket_routes={"broker": "broker"},
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "nginx.conf"
+            # Pre-existing longer content must be truncated
+            output_path.write_text("x" * 100_000)
+
+            write_nginx_config(config, output_path)
+
+            assert output_path.read_text() == render_nginx_config(config)
+
+    def test_nginx_config_digest_recorded_in_header(self) -> None:
+        """Test generated config records a digest that tracks config changes."""
+        config = DeploymentConfig(
+            nginx=NginxConfig(port=8000, worker_processes=1, worker_connections=1024),
+            servers={
+                "broker": ServerConfig(
+                    port=8001, instances=1, modules=["broker"], reload=True
+                ),
+            },
+            websocket=WebSocketConfig(routing_strategy="path", query_param_name="type"),
+            websocket_routes={"broker": "broker"},
+        )
+        changed_config = config.model_copy(
+            update={"nginx": NginxConfig(port=9000, worker_processes=1)}
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "nginx.conf"
+            assert read_nginx_config_digest(output_path) is None
+
+            write_nginx_config(config, output_path)
+
+            digest = read_nginx_config_digest(output_path)
+            assert digest == nginx_config_digest(config)
+            assert digest != nginx_config_digest(changed_config)
+
+    def test_nginx_config_digest_tracks_generator_source(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test template edits (generator source changes) change the digest."""
+        config = DeploymentConfig(
+            nginx=NginxConfig(port=8000, worker_processes=1, worker_connections=1024),
+            servers={
+                "broker": ServerConfig(
+                    port=8001, instances=1, modules=["broker"], reload=True
+                ),
+            },
+            websocket=WebSocketConfig(routing_strategy="path", query_param_name="type"),
+            websocket_routes={"broker": "broker"},
+        )
+        digest = nginx_config_digest(config)
+
+        monkeypatch.setattr(
+            backend_manager, "_nginx_generator_digest", lambda: "edited-templates"
+        )
+
+        assert nginx_config_digest(config) != digest
+
+
+@pytest.mark.unit
+class TestNginxConfigPreparation:
+    """Unit tests for ServerManager nginx config generation and validation."""
+
+    @pytest.fixture
+    def validated(self, monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+        """Record validate_nginx_config calls instead of running nginx -t."""
+        calls: list[Path] = []
+
+        def fake_validate(config_path: Path) -> bool:
+            calls.append(config_path)
+            return True
+
+        monkeypatch.setattr(backend_manager, "validate_nginx_config", fake_validate)
+        return calls
+
+    @pytest.fixture
+    def manager(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> ServerManager:
+        """Create ServerManager working in a temporary directory."""
+        monkeypatch.chdir(tmp_path)
+        config = DeploymentConfig(
+            nginx=NginxConfig(port=18000, worker_processes=1, worker_connections=1024),
+            servers={
+                "broker": ServerConfig(
+                    port=18001, instances=1, modules=["broker"], reload=True
+                ),
+            },
+            websocket=WebSocketConfig(routing_strategy="path", query_param_name="type"),
+            websocket_routes={"broker": "broker"},
+        )
+        return ServerManager(config)
+
+    def test_init_does_not_touch_nginx_config(
+        self, manager: ServerManager, validated: list[Path]
+    ) -> None:
+        """Test constructing a manager (e.g. for stop/status) writes nothing."""
+        assert not manager.nginx_config_path.exists()
+        assert validated == []
+
+    def test_missing_config_is_generated(
+        self, manager: ServerManager, validated: list[Path]
+    ) -> None:
+        """Test a missing config is generated with its digest header."""
+        manager.prepare_nginx_config()
+
+        assert read_nginx_config_digest(manager.nginx_config_path) == (
+            nginx_config_digest(manager.config, pid_file=manager.nginx_pid_file)
+        )
+        assert validated == []
+
+    def test_existing_config_is_validated_not_rewritten(
+        self, manager: ServerManager, validated: list[Path]
+    ) -> None:
+        """Test an existing config without a hash header is kept by default."""
+        manager.nginx_config_path.write_text("# hand-written config\n")
+
+        manager.prepare_nginx_config()
+
+        assert manager.nginx_config_path.read_text() == "# hand-written config\n"
+        assert validated == [manager.nginx_config_path]
+
+    def test_regenerate_skips_matching_digest(
+        self, manager: ServerManager, validated: list[Path]
+    ) -> None:
+        """Test --generate-nginx keeps a config whose digest still matches."""
+        write_nginx_config(
+            manager.config, manager.nginx_config_path, pid_file=manager.nginx_pid_file
+        )
+        with open(manager.nginx_config_path, "a") as f:
+            f.write("# marker\n")
+
+        manager.prepare_nginx_config(regenerate=True)
+
+        assert manager.nginx_config_path.read_text().endswith("# marker\n")
+        assert validated == [manager.nginx_config_path]
+
+    def test_regenerate_rewrites_stale_config(
+        self, manager: ServerManager, validated: list[Path]
+    ) -> None:
+        """Test --generate-nginx rewrites a config with a stale or missing digest."""
+        manager.nginx_config_path.write_text("# hand-written config\n")
+
+        manager.prepare_nginx_config(regenerate=True)
+
+        assert manager.nginx_config_path.read_text() == render_nginx_config(
+            manager.config, pid_file=manager.nginx_pid_file
+        )
+        assert validated == []
@@ -6,6 +6,7 @@ detached mode. They use temporary directories and don't start real processes.
 Test Coverage:
 - _write_pid_file() - Write PID to file for process tracking
 - _read_pid_file() - Read PID from file
+- _read_all_pids() - Read all PID files in one directory scan
 - _is_process_running() - Check if a process is running by PID
 """
 
@@ -100,6 +101,15 @@ class TestPidFileManagement:
         pid = manager._read_pid_file(instance_name)
         assert pid is None
 
+    def test_read_all_pids(self, manager: ServerManager) -> None:
+        """Test reading all PID files skips invalid and non-PID files."""
+        manager._write_pid_file("broker-0", 12345)
+        manager._write_pid_file("broker-1", 12346)
+        (manager.pid_dir / "invalid-0.pid").write_text("not-a-number")
+        (manager.pid_dir / "notes.txt").write_text("42")
+
+        assert manager._read_all_pids() == {"broker-0": 12345, "broker-1": 12346}
+
     def test_is_process_running_with_current_process(
         self, manager: ServerManager
     ) -> None:
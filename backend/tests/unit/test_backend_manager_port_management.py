@@ -7,13 +7,14 @@ frequent execution.
 Test Coverage:
 - is_port_in_use() - Check if a port is currently bound
 - check_all_ports() - Validate all required ports are available
+- find_ports_in_use() - Probe several ports concurrently
 """
 
 import socket
 
 import pytest
 
-from scripts.backend_manager import check_all_ports, is_port_in_use
+from scripts.backend_manager import check_all_ports, find_ports_in_use, is_port_in_use
 from trading_api.shared.deployment import (
     DeploymentConfig,
     NginxConfig,
@@ -131,3 +132,17 @@ class TestPortManagement:
         # Should check ports 18000, 18001, 18002, 18003
         all_available, _ = check_all_ports(config)
         assert all_available
+
+    async def test_find_ports_in_use(self) -> None:
+        """Test that only bound ports are reported, in input order."""
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as free:
+            free.bind(("127.0.0.1", 0))
+            free_port = free.getsockname()[1]
+
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as blocker:
+            blocker.bind(("127.0.0.1", 0))
+            blocked_port = blocker.getsockname()[1]
+
+            assert await find_ports_in_use([free_port, blocked_port]) == [blocked_port]
+
+        assert await find_ports_in_use([free_port, blocked_port]) == []
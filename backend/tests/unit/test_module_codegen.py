@@ -2,11 +2,16 @@
 
 import subprocess
 import sys
+import threading
 from pathlib import Path
+from typing import Any
+
+import pytest
 
 # Add src to path for module imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 
+from scripts import module_codegen  # noqa: E402
 from trading_api.modules.broker import BrokerModule  # noqa: E402
 from trading_api.modules.datafeed import DatafeedModule  # noqa: E402
 from trading_api.shared.module_interface import ModuleApp  # noqa: E402
@@ -78,3 +83,61 @@ class TestModuleCodegen:
         # (actual file generation tested in integration tests)
         assert hasattr(module_app, "gen_specs_and_clients")
         assert callable(module_app.gen_specs_and_clients)
+
+
+class TestModuleCodegenFanOut:
+    """Test module_codegen.main() parallel and serial generation."""
+
+    @pytest.fixture
+    def module_apps(
+        self, fake_module_apps: dict[str, Any], monkeypatch: pytest.MonkeyPatch
+    ) -> dict[str, Any]:
+        monkeypatch.setattr(
+            module_codegen, "load_module_app", fake_module_apps.__getitem__
+        )
+        return fake_module_apps
+
+    def run_main(self, monkeypatch: pytest.MonkeyPatch, *args: str) -> None:
+        monkeypatch.setattr(sys, "argv", ["module_codegen.py", *args])
+        module_codegen.main()
+
+    def test_generates_all_modules_in_parallel(
+        self,
+        module_apps: dict[str, Any],
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
+    ):
+        """Test each module is generated once, off the main thread."""
+        self.run_main(monkeypatch, "broker,datafeed")
+
+        stdout = capsys.readouterr().out
+        for name, module_app in module_apps.items():
+            assert module_app.calls == [(False, None)]
+            assert module_app.thread_ids != [threading.get_ident()]
+            assert f"Successfully generated for {name}" in stdout
+
+    def test_no_parallel_is_serial(
+        self, module_apps: dict[str, Any], monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test --no-parallel generates every module on the main thread."""
+        self.run_main(monkeypatch, "broker,datafeed", "--no-parallel")
+
+        for module_app in module_apps.values():
+            assert module_app.thread_ids == [threading.get_ident()]
+
+    def test_failure_fails_batch_and_names_module(
+        self,
+        module_apps: dict[str, Any],
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
+    ):
+        """Test one module raising in the parallel path exits 1 naming it."""
+        module_apps["datafeed"].error = RuntimeError("spec export failed")
+
+        with pytest.raises(SystemExit) as exc_info:
+            self.run_main(monkeypatch, "broker,datafeed")
+
+        assert exc_info.value.code == 1
+        stderr = capsys.readouterr().err
+        assert "❌ Failed for datafeed: spec export failed" in stderr
+        assert "Failed for broker" not in stderr
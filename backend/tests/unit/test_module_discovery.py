@@ -0,0 +1,69 @@
+"""Unit tests for cached module discovery in trading_api.shared.utils.
+
+Test Coverage:
+- discover_modules() - Module directories with __init__.py
+- discover_modules_with_websockets() - Modules with ws.py or ws/
+- Cache invalidation when files change inside an existing module directory
+"""
+
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from trading_api.shared.utils import discover_modules, discover_modules_with_websockets
+
+
+@pytest.fixture
+def modules_dir(tmp_path: Path) -> Path:
+    """Create a modules directory with one plain and one WebSocket module."""
+    for name in ("broker", "datafeed"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "__init__.py").touch()
+    (tmp_path / "datafeed" / "ws.py").touch()
+    (tmp_path / "__pycache__").mkdir()
+    return tmp_path
+
+
+@pytest.mark.unit
+class TestModuleDiscovery:
+    """Unit tests for module discovery and its per-process cache."""
+
+    def test_discovers_modules(self, modules_dir: Path) -> None:
+        """Test module and WebSocket module discovery."""
+        assert discover_modules(modules_dir) == ["broker", "datafeed"]
+        assert discover_modules_with_websockets(modules_dir) == ["datafeed"]
+
+    def test_added_ws_module_invalidates_cache(
+        self, modules_dir: Path, bump_mtime: Callable[[Path], None]
+    ) -> None:
+        """Test adding ws/ inside an existing module is picked up."""
+        assert discover_modules_with_websockets(modules_dir) == ["datafeed"]
+
+        (modules_dir / "broker" / "ws").mkdir()
+        bump_mtime(modules_dir / "broker")
+
+        assert discover_modules_with_websockets(modules_dir) == ["broker", "datafeed"]
+
+    def test_removed_ws_file_invalidates_cache(
+        self, modules_dir: Path, bump_mtime: Callable[[Path], None]
+    ) -> None:
+        """Test removing ws.py inside an existing module is picked up."""
+        assert discover_modules_with_websockets(modules_dir) == ["datafeed"]
+
+        (modules_dir / "datafeed" / "ws.py").unlink()
+        bump_mtime(modules_dir / "datafeed")
+
+        assert discover_modules_with_websockets(modules_dir) == []
+
+    def test_added_init_invalidates_cache(
+        self, modules_dir: Path, bump_mtime: Callable[[Path], None]
+    ) -> None:
+        """Test a directory becoming a package is picked up."""
+        (modules_dir / "auth").mkdir()
+        assert discover_modules(modules_dir) == ["broker", "datafeed"]
+
+        (modules_dir / "auth" / "__init__.py").touch()
+        bump_mtime(modules_dir / "auth")
+
+        assert discover_modules(modules_dir) == ["auth", "broker", "datafeed"]
@@ -0,0 +1,152 @@
+"""Unit tests for the WebSocket router generator's skip-if-unchanged logic.
+
+Test Coverage:
+- _generation_inputs_digest() - Inputs tracked for regeneration
+- _routers_up_to_date() - Recorded digest and generated files check
+- generate_ws_routers() - Second run skips regeneration
+"""
+
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from trading_api.shared.ws import module_router_generator
+from trading_api.shared.ws.module_router_generator import (
+    RouterSpec,
+    _generation_inputs_digest,
+    _routers_up_to_date,
+    generate_ws_routers,
+)
+
+WS_FILE = b"""\
+from typing import TypeAlias
+
+from trading_api.models import Bar, BarsSubscriptionRequest
+from trading_api.shared.ws.generic_route import WsRouter
+
+BarWsRouter: TypeAlias = WsRouter[BarsSubscriptionRequest, Bar]
+"""
+
+TEMPLATE = b"""\
+from trading_api.models import SubscriptionUpdate
+from trading_api.shared.ws.ws_route_interface import WsRouteInterface
+"""
+
+
+@pytest.fixture
+def backend_dir(tmp_path: Path) -> Path:
+    """Create a minimal backend tree with a ws file, models and tool configs."""
+    src = tmp_path / "src" / "trading_api"
+    (src / "models" / "market").mkdir(parents=True)
+    (src / "models" / "__init__.py").write_text("from .market.bars import Bar\n")
+    (src / "models" / "market" / "__init__.py").touch()
+    (src / "models" / "market" / "bars.py").write_text("class Bar: ...\n")
+    (src / "shared" / "ws").mkdir(parents=True)
+    (src / "shared" / "ws" / "generic_route.py").write_bytes(TEMPLATE)
+    (src / "shared" / "ws" / "ws_route_interface.py").touch()
+    (src / "modules" / "demo" / "ws" / "v1").mkdir(parents=True)
+    (src / "modules" / "demo" / "ws" / "v1" / "__init__.py").write_bytes(WS_FILE)
+    (tmp_path / "pyproject.toml").write_text("[tool.black]\nline-length = 88\n")
+    (tmp_path / "poetry.lock").write_text('name = "black"\nversion = "23.11.0"\n')
+    return tmp_path
+
+
+def digest(backend_dir: Path, skip_quality_checks: bool = False) -> str:
+    router_path = backend_dir / "src/trading_api/modules/demo/ws/v1/__init__.py"
+    return _generation_inputs_digest(
+        router_path, TEMPLATE, skip_quality_checks, backend_dir
+    )
+
+
+@pytest.mark.unit
+class TestGenerationInputsDigest:
+    """Unit tests for the generation inputs digest."""
+
+    def test_digest_is_stable(self, backend_dir: Path) -> None:
+        """Test unchanged inputs give the same digest (skip path)."""
+        assert digest(backend_dir) == digest(backend_dir)
+
+    def test_model_change_invalidates(
+        self, backend_dir: Path, bump_mtime: Callable[[Path], None]
+    ) -> None:
+        """Test editing a model module imported through a package changes it."""
+        before = digest(backend_dir)
+
+        bars = backend_dir / "src/trading_api/models/market/bars.py"
+        bars.write_text("class RenamedBar: ...\n")
+        bump_mtime(bars)
+
+        assert digest(backend_dir) != before
+
+    def test_template_import_change_invalidates(
+        self, backend_dir: Path, bump_mtime: Callable[[Path], None]
+    ) -> None:
+        """Test modules imported by the template are tracked as well."""
+        before = digest(backend_dir)
+
+        interface = backend_dir / "src/trading_api/shared/ws/ws_route_interface.py"
+        interface.write_text("class WsRouteInterface: ...\n")
+        bump_mtime(interface)
+
+        assert digest(backend_dir) != before
+
+    def test_tool_config_change_invalidates_when_checks_run(
+        self, backend_dir: Path
+    ) -> None:
+        """Test a formatter bump reruns checks, but not in skip-checks mode."""
+        before = digest(backend_dir)
+        before_skip = digest(backend_dir, skip_quality_checks=True)
+
+        (backend_dir / "poetry.lock").write_text('name = "black"\nversion = "24.1.0"\n')
+        (backend_dir / ".flake8").write_text("[flake8]\nmax-line-length = 88\n")
+
+        assert digest(backend_dir) != before
+        assert digest(backend_dir, skip_quality_checks=True) == before_skip
+
+
+@pytest.mark.unit
+class TestRoutersUpToDate:
+    """Unit tests for the ws_generated/ freshness check."""
+
+    SPECS = [RouterSpec("BarWsRouter", "BarsSubscriptionRequest", "Bar", "demo")]
+
+    def write_generated(self, output_dir: Path, inputs_digest: str) -> None:
+        output_dir.mkdir()
+        (output_dir / "__init__.py").touch()
+        (output_dir / "barwsrouter.py").touch()
+        (output_dir / module_router_generator._INPUTS_DIGEST_FILE).write_text(
+            inputs_digest
+        )
+
+    def test_matching_digest_is_up_to_date(self, tmp_path: Path) -> None:
+        """Test a matching digest with all files present skips regeneration."""
+        self.write_generated(tmp_path / "ws_generated", "abc")
+
+        assert _routers_up_to_date(tmp_path / "ws_generated", self.SPECS, "abc")
+
+    def test_stale_digest_is_not_up_to_date(self, tmp_path: Path) -> None:
+        """Test a changed digest forces regeneration."""
+        self.write_generated(tmp_path / "ws_generated", "abc")
+
+        assert not _routers_up_to_date(tmp_path / "ws_generated", self.SPECS, "def")
+
+    def test_missing_file_is_not_up_to_date(self, tmp_path: Path) -> None:
+        """Test a deleted generated router forces regeneration."""
+        self.write_generated(tmp_path / "ws_generated", "abc")
+        (tmp_path / "ws_generated" / "barwsrouter.py").unlink()
+
+        assert not _routers_up_to_date(tmp_path / "ws_generated", self.SPECS, "abc")
+
+
+@pytest.mark.unit
+def test_second_generation_is_skipped(capsys: pytest.CaptureFixture[str]) -> None:
+    """Test regenerating unchanged routers reports them as up to date."""
+    ws_file = "modules/datafeed/ws/v1/__init__.py"
+
+    assert generate_ws_routers(ws_file, skip_quality_checks=True)
+    capsys.readouterr()
+
+    assert generate_ws_routers(ws_file, skip_quality_checks=True)
+
+    assert "are up to date" in capsys.readouterr().out
@@ -0,0 +1,106 @@
+"""Unit tests for the generated spec change detection in module_interface.
+
+Test Coverage:
+- _spec_needs_update() - Decide whether a spec file must be (re)written
+"""
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from trading_api.shared.module_interface import _spec_needs_update
+from trading_api.shared.utils import dump_json_bytes
+
+SPEC: dict[str, Any] = {
+    "openapi": "3.1.0",
+    "paths": {"/orders": {"get": {"summary": "Get Orders"}}},
+    "components": {"schemas": {"Order": {"properties": {"id": {}, "qty": {}}}}},
+}
+
+
+def needs_update(spec_file: Path, spec: dict[str, Any], pretty: bool = False) -> bool:
+    return _spec_needs_update(
+        spec_file,
+        dump_json_bytes(spec, pretty=pretty),
+        spec,
+        "OpenAPI",
+        "broker",
+        clean_first=False,
+    )
+
+
+@pytest.fixture
+def spec_file(tmp_path: Path) -> Path:
+    """Write SPEC to disk as compact JSON, as a previous generation would."""
+    path = tmp_path / "broker_openapi.json"
+    path.write_bytes(dump_json_bytes(SPEC, pretty=False))
+    return path
+
+
+@pytest.mark.unit
+class TestSpecNeedsUpdate:
+    """Unit tests for _spec_needs_update()."""
+
+    def test_unchanged_spec_is_not_rewritten(
+        self, spec_file: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test byte-identical output skips the write without parsing."""
+
+        def fail_parse(data: bytes) -> Any:
+            raise AssertionError("byte-identical spec should not be parsed")
+
+        monkeypatch.setattr(
+            "trading_api.shared.module_interface.load_json_bytes", fail_parse
+        )
+
+        assert not needs_update(spec_file, SPEC)
+
+    def test_toggled_formatting_is_rewritten(self, spec_file: Path) -> None:
+        """Test switching PRETTY_SPECS rewrites an otherwise unchanged spec."""
+        assert needs_update(spec_file, SPEC, pretty=True)
+
+        spec_file.write_bytes(dump_json_bytes(SPEC, pretty=True))
+
+        assert needs_update(spec_file, SPEC, pretty=False)
+
+    def test_metadata_only_change_is_not_rewritten(self, spec_file: Path) -> None:
+        """Test differing bytes without a meaningful change skip the write."""
+        changed = {**SPEC, "info": {"description": "Broker API"}}
+
+        assert not needs_update(spec_file, changed)
+
+    def test_changed_spec_is_rewritten(
+        self, spec_file: Path, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test a new endpoint triggers a rewrite and is reported."""
+        changed = {
+            **SPEC,
+            "paths": {**SPEC["paths"], "/positions": {"get": {}}},
+        }
+
+        with caplog.at_level("INFO"):
+            assert needs_update(spec_file, changed)
+
+        assert "spec changes detected for 'broker'" in caplog.text
+
+    def test_changed_schema_is_rewritten(self, spec_file: Path) -> None:
+        """Test a changed model property triggers a rewrite."""
+        changed = {
+            **SPEC,
+            "components": {"schemas": {"Order": {"properties": {"id": {}}}}},
+        }
+
+        assert needs_update(spec_file, changed)
+
+    def test_missing_spec_is_written(self, tmp_path: Path) -> None:
+        """Test a spec that does not exist yet is created."""
+        assert needs_update(tmp_path / "broker_openapi.json", SPEC)
+
+    def test_clean_first_always_writes(self, spec_file: Path) -> None:
+        """Test clean_first rewrites even an unchanged spec."""
+        spec_bytes = spec_file.read_bytes()
+
+        assert _spec_needs_update(
+            spec_file, spec_bytes, SPEC, "OpenAPI", "broker", clean_first=True
+        )